@@ -1,7 +1,15 @@
 """Streamlit dashboard entry point - AI Investment Orchestrator."""
 
+import os
+import sys
+
 import streamlit as st
 
+# Make `src` and `dashboard` importable from every page, once per process
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
 st.set_page_config(
     page_title="AI Investment Orchestrator",
     page_icon="📊",
@@ -0,0 +1,47 @@
+"""Shared access to the audit SQLite DB for dashboard pages."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+
+from src.audit_logger import AuditLogger
+
+DB_PATH = Path("data/audit.db")
+
+
+@st.cache_resource
+def _shared_conn() -> tuple[sqlite3.Connection, threading.Lock]:
+    """One connection per process, tuned once, plus the lock that guards it."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn, threading.Lock()
+
+
+@contextmanager
+def audit_db() -> Iterator[sqlite3.Connection]:
+    """Hold the shared audit DB connection for the duration of the block.
+
+    Every session and fragment thread uses the same connection, so fetch
+    results inside the block.
+    """
+    conn, lock = _shared_conn()
+    with lock:
+        yield conn
+
+
+@st.cache_resource
+def auditor() -> AuditLogger:
+    """The dashboard's one AuditLogger, so every page shares its connection and lock."""
+    return AuditLogger(db_path=DB_PATH)
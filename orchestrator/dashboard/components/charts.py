@@ -2,51 +2,103 @@
 
 from __future__ import annotations
 
-import sqlite3
-from pathlib import Path
-
+import numpy as np
+import pandas as pd
 import streamlit as st
 
-DB_PATH = Path("data/audit.db")
-
-
+try:
+    import plotly.graph_objects as go
+    _HAS_PLOTLY = True
+except ImportError:
+    _HAS_PLOTLY = False
+
+from dashboard.components.audit_db import DB_PATH, audit_db
+
+# A 400px-tall line chart can't show more detail than this per trace
+MAX_CHART_POINTS = 1000
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling; returns indices of kept points.
+
+    First and last points are always kept. Each middle bucket keeps the point
+    forming the largest triangle with the previously kept point and the mean
+    of the next bucket, which preserves the visual shape of the series.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        kept[i + 1] = a
+    return kept
+
+
+@st.fragment
 def render_performance_chart(config: dict, audit) -> None:
     """Render portfolio performance comparison chart."""
+    accounts = config.get("accounts", {})
+    if not accounts:
+        st.info("No accounts configured yet.")
+        return
+
     if not DB_PATH.exists():
         st.info("No performance data yet. Charts will appear after decision cycles run.")
         return
 
-    try:
-        import plotly.graph_objects as go
-
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+    if not _HAS_PLOTLY:
+        st.warning("Install plotly for charts: pip install plotly")
+        return
 
-        accounts = config.get("accounts", {})
+    try:
         fig = go.Figure()
 
+        placeholders = ",".join("?" * len(accounts))
+        with audit_db() as conn:
+            df = pd.read_sql_query(
+                f"""SELECT account_key, timestamp, portfolio_value
+                FROM decision_log
+                WHERE account_key IN ({placeholders}) AND success = 1 AND portfolio_value IS NOT NULL
+                ORDER BY account_key, timestamp""",
+                conn,
+                params=tuple(accounts),
+                parse_dates={"timestamp": {"format": "ISO8601"}},
+            )
+        series_by_account = dict(list(df.groupby("account_key", sort=False)))
+
         for key, acct in accounts.items():
             name = acct.get("name", key)
-            rows = conn.execute(
-                """SELECT timestamp, portfolio_value, portfolio_pl_pct
-                FROM decision_log
-                WHERE account_key = ? AND success = 1 AND portfolio_value IS NOT NULL
-                ORDER BY timestamp""",
-                (key,),
-            ).fetchall()
-
-            if rows:
-                dates = [r["timestamp"][:10] for r in rows]
-                values = [r["portfolio_value"] for r in rows]
-                fig.add_trace(go.Scatter(
-                    x=dates,
+            series = series_by_account.get(key)
+
+            if series is not None and not series.empty:
+                ts = series["timestamp"]
+                values = series["portfolio_value"].to_numpy(dtype=float)
+                if len(values) > MAX_CHART_POINTS:
+                    x = ts.to_numpy().astype("datetime64[ns]").astype(np.int64).astype(float)
+                    kept = _lttb_indices(x, values, MAX_CHART_POINTS)
+                    ts = ts.iloc[kept]
+                    values = values[kept]
+                fig.add_trace(go.Scattergl(
+                    x=ts.dt.normalize().to_numpy(),
                     y=values,
                     mode="lines+markers",
                     name=name,
                 ))
 
-        conn.close()
-
         if fig.data:
             # Add initial budget line
             initial = config.get("defaults", {}).get("initial_budget", 10000)
@@ -64,44 +116,48 @@ def render_performance_chart(config: dict, audit) -> None:
                 hovermode="x unified",
                 height=400,
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="perf_chart")
         else:
             st.info("No performance data to chart yet.")
 
-    except ImportError:
-        st.warning("Install plotly for charts: pip install plotly")
     except Exception as e:
         st.error(f"Chart error: {e}")
 
 
+@st.fragment
 def render_pl_comparison(config: dict) -> None:
     """Render P/L comparison bar chart."""
-    if not DB_PATH.exists():
+    accounts = config.get("accounts", {})
+    if not accounts or not DB_PATH.exists() or not _HAS_PLOTLY:
         return
 
     try:
-        import plotly.graph_objects as go
-
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-
-        accounts = config.get("accounts", {})
         names = []
         pl_values = []
 
+        # Latest non-null P/L per account in a single pass
+        placeholders = ",".join("?" * len(accounts))
+        with audit_db() as conn:
+            latest_pl = {
+                row["account_key"]: row["portfolio_pl_pct"]
+                for row in conn.execute(
+                    f"""SELECT account_key, portfolio_pl_pct FROM (
+                        SELECT account_key, portfolio_pl_pct,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY account_key ORDER BY timestamp DESC
+                               ) AS rn
+                        FROM decision_log
+                        WHERE account_key IN ({placeholders})
+                          AND success = 1 AND portfolio_pl_pct IS NOT NULL
+                    ) WHERE rn = 1""",
+                    tuple(accounts),
+                )
+            }
+
         for key, acct in accounts.items():
-            row = conn.execute(
-                """SELECT portfolio_pl_pct FROM decision_log
-                WHERE account_key = ? AND success = 1 AND portfolio_pl_pct IS NOT NULL
-                ORDER BY timestamp DESC LIMIT 1""",
-                (key,),
-            ).fetchone()
-
-            if row:
+            if key in latest_pl:
                 names.append(acct.get("name", key))
-                pl_values.append(row["portfolio_pl_pct"])
-
-        conn.close()
+                pl_values.append(latest_pl[key])
 
         if names:
             colors = ["green" if v >= 0 else "red" for v in pl_values]
@@ -117,7 +173,7 @@ def render_pl_comparison(config: dict) -> None:
                 yaxis_title="P/L (%)",
                 height=300,
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, use_container_width=True, key="pl_bar")
 
     except Exception as e:
         st.error(f"P/L chart error: {e}")
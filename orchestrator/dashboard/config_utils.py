@@ -1,27 +1,110 @@
 """Shared config load/save used by all dashboard pages."""
 
+import copy
+import hashlib
+import pickle
 from pathlib import Path
 
+import streamlit as st
 import yaml
 
-CONFIG_PATH = Path("data/config.yaml")
+from src.config_io import config_to_yaml, write_config
+
+# String form for the hot open()/cache-key paths; Path form for stat()/mkdir()
+CONFIG_PATH_STR = "data/config.yaml"
+CONFIG_PATH = Path(CONFIG_PATH_STR)
 _BAKED_DEFAULT = Path("/app/default_config.yaml")
 
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_yaml(path: Path | str) -> tuple[dict, bytes]:
+    """Parse a YAML file from one binary read; also return the raw bytes."""
+    # Bytes in: libyaml detects the encoding itself, skipping text-mode decoding
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = yaml.load(raw, Loader=_Loader)
+    return (data if data else {}), raw
+
+
+# The baked-in default ships with the image and never changes: parse it once.
+try:
+    _BAKED_DEFAULT_DATA: dict | None = _read_yaml(_BAKED_DEFAULT)[0]
+except OSError:
+    _BAKED_DEFAULT_DATA = None
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_from_disk(path_str: str, mtime_ns: int) -> tuple[dict, bytes]:
+    """Parse a YAML file. mtime_ns is part of the cache key so edits invalidate it."""
+    return _read_yaml(path_str)
+
 
 def load_config(fallback: dict | None = None) -> dict:
     """Load runtime config, falling back to the baked-in default if missing."""
-    for path in [CONFIG_PATH, _BAKED_DEFAULT]:
-        try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-                return data if data else {}
-        except (OSError, FileNotFoundError):
-            continue
+    try:
+        return _load_from_disk(CONFIG_PATH_STR, CONFIG_PATH.stat().st_mtime_ns)[0]
+    except OSError:
+        pass
+    if _BAKED_DEFAULT_DATA is not None:
+        return copy.deepcopy(_BAKED_DEFAULT_DATA)
     return fallback if fallback is not None else {}
 
 
-def save_config(config: dict) -> None:
-    """Write config, creating data/ directory if needed."""
-    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+def raw_config_text() -> str | None:
+    """Config file contents as written on disk, or None if it does not exist yet."""
+    try:
+        # Same cached read that load_config parsed: no second read or dump
+        return _load_from_disk(CONFIG_PATH_STR, CONFIG_PATH.stat().st_mtime_ns)[1].decode("utf-8")
+    except OSError:
+        return None
+
+
+def config_mtime_ns() -> int:
+    """mtime of the runtime config file, 0 if it does not exist yet."""
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _accounts_by_strategy(mtime_ns: int, strategy: str, include: bool) -> dict:
+    accounts = load_config().get("accounts", {})
+    return {
+        key: acct for key, acct in accounts.items()
+        if (acct.get("strategy", "") == strategy) == include
+    }
+
+
+def accounts_by_strategy(strategy: str, include: bool = True) -> dict:
+    """Accounts whose strategy is (or, with include=False, is not) `strategy`."""
+    return _accounts_by_strategy(config_mtime_ns(), strategy, include)
+
+
+def save_config(config: dict) -> bool:
+    """Write config atomically, creating data/ directory if needed.
+
+    Same writer as AccountManager.save_config (src.config_io.write_config):
+    unchanged configs are not rewritten. Returns True if written.
+    """
+    if not write_config(CONFIG_PATH, config):
+        return False
+    _load_from_disk.clear()
+    return True
+
+
+def config_digest(config: dict) -> bytes:
+    """Cheap content fingerprint of a config dict."""
+    return hashlib.blake2b(pickle.dumps(config), digest_size=16).digest()
+
+
+def save_config_if_dirty(config: dict, original_digest: bytes | None) -> bool:
+    """Save config only if it differs from the version fingerprinted at load time.
+
+    Returns True if the file was written.
+    """
+    if original_digest is not None and config_digest(config) == original_digest:
+        return False
+    return save_config(config)
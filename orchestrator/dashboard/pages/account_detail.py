@@ -1,13 +1,9 @@
 """Account detail page: positions, decision history, P/L per holding."""
 
 import streamlit as st
-from pathlib import Path
-import sys
-import json
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from src.audit_logger import AuditLogger
+from dashboard.components.audit_db import auditor
 from dashboard.config_utils import load_config
 
 
@@ -27,7 +23,7 @@ selected_key = st.selectbox(
 )
 
 acct = accounts[selected_key]
-audit = AuditLogger()
+audit = auditor()
 
 # Account info
 col1, col2, col3 = st.columns(3)
@@ -59,9 +55,53 @@ st.write(", ".join(acct.get("watchlist", [])))
 
 st.divider()
 
+
+@st.fragment
+def _render_log_detail(audit: AuditLogger, log_file: str, detail: dict | None = None) -> None:
+    """Trades and risk notes for one cycle; the log file is only read once toggled on."""
+    if not st.toggle("Show trades & risk details", key=f"expanded_{log_file}"):
+        return
+    if detail is None:
+        detail = audit.get_log_detail(log_file)
+    if not detail:
+        return
+    trades = detail.get("executed_trades", [])
+    if trades:
+        st.write("**Executed Trades:**")
+        for t in trades:
+            status = "OK" if t.get("success") else "FAILED"
+            err = f" — {t['error']}" if t.get("error") else ""
+            # Options trades (wheel/spreads) have spread_type; equity trades have quantity
+            if t.get("spread_type"):
+                pl = t.get("realized_pl")
+                pl_str = f" P/L=${pl:+.2f}" if pl is not None else ""
+                line = (f"  {t.get('type')} {t.get('symbol')} "
+                        f"[{t.get('spread_type','')}]{pl_str} [{status}]{err}")
+            else:
+                line = (f"  {t.get('type')} {t.get('symbol')} "
+                        f"qty={t.get('quantity', 0):.4f} @ ${t.get('price', 0):.2f} "
+                        f"= ${t.get('total', 0):,.2f} [{status}]{err}")
+            st.write(line)
+
+    risk_mods = detail.get("risk_manager", {})
+    if risk_mods.get("modifications"):
+        st.write("**Risk Modifications:**")
+        for m in risk_mods["modifications"]:
+            st.write(f"  - {m}")
+    if risk_mods.get("warnings"):
+        st.write("**Risk Warnings:**")
+        for w in risk_mods["warnings"]:
+            st.warning(w)
+
+
 # Decision history
 st.subheader("Decision History")
 logs = audit.get_recent_logs(account_key=selected_key, limit=20)
+# Rows left open from a previous rerun are read together up front
+details = audit.get_log_details_bulk([
+    log["log_file"] for log in logs
+    if log.get("log_file") and st.session_state.get(f"expanded_{log['log_file']}")
+])
 
 if logs:
     for log in logs:
@@ -82,37 +122,8 @@ if logs:
             if error:
                 st.error(f"Error: {error}")
 
-            # Load full log
             log_file = log.get("log_file")
             if log_file:
-                detail = audit.get_log_detail(log_file)
-                if detail:
-                    trades = detail.get("executed_trades", [])
-                    if trades:
-                        st.write("**Executed Trades:**")
-                        for t in trades:
-                            status = "OK" if t.get("success") else "FAILED"
-                            err = f" — {t['error']}" if t.get("error") else ""
-                            # Options trades (wheel/spreads) have spread_type; equity trades have quantity
-                            if t.get("spread_type"):
-                                pl = t.get("realized_pl")
-                                pl_str = f" P/L=${pl:+.2f}" if pl is not None else ""
-                                line = (f"  {t.get('type')} {t.get('symbol')} "
-                                        f"[{t.get('spread_type','')}]{pl_str} [{status}]{err}")
-                            else:
-                                line = (f"  {t.get('type')} {t.get('symbol')} "
-                                        f"qty={t.get('quantity', 0):.4f} @ ${t.get('price', 0):.2f} "
-                                        f"= ${t.get('total', 0):,.2f} [{status}]{err}")
-                            st.write(line)
-
-                    risk_mods = detail.get("risk_manager", {})
-                    if risk_mods.get("modifications"):
-                        st.write("**Risk Modifications:**")
-                        for m in risk_mods["modifications"]:
-                            st.write(f"  - {m}")
-                    if risk_mods.get("warnings"):
-                        st.write("**Risk Warnings:**")
-                        for w in risk_mods["warnings"]:
-                            st.warning(w)
+                _render_log_detail(audit, log_file, details.get(log_file))
 else:
     st.info("No decision history for this account yet.")
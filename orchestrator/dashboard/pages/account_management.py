@@ -1,117 +1,119 @@
 """Account management page: create, edit, delete accounts."""
 
+import re
+import pandas as pd
 import streamlit as st
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from src.llm_client import LLMClient
 from src.account_manager import AccountManager
-from dashboard.config_utils import load_config, save_config, CONFIG_PATH
+from dashboard.config_utils import load_config, save_config_if_dirty, config_digest, CONFIG_PATH_STR
+from dashboard.strategy_defaults import STRATEGY_TEMPLATES, SCHEDULE_PRESETS, DEFAULT_WATCHLISTS
 
-STRATEGY_TEMPLATES = {
-    "core_satellite": {
-        "description": "Core-Satellite: 60% ETF core + 30% stock satellites + 10% cash reserve",
-        "prompt_style": "Balance risk and return. Prefer broad ETF exposure as core, select individual stocks as satellites for alpha.",
-        "preferred_metrics": ["SMA", "RSI", "PE"],
-        "horizon": "weeks to months",
-    },
-    "value_investing": {
-        "description": "Value Investing: 40% ETF + 50% undervalued stocks + 10% cash reserve",
-        "prompt_style": "Seek undervalued assets with margin of safety. Focus on fundamentals, dividends, and long-term compounding.",
-        "preferred_metrics": ["PE", "PB", "DividendYield", "FCF"],
-        "horizon": "months to years",
-    },
-    "momentum": {
-        "description": "Momentum/Swing: 20% ETF + 70% high-momentum stocks + 10% cash reserve",
-        "prompt_style": "Ride momentum, cut losers fast. Focus on technical breakouts, volume surges, and trend strength.",
-        "preferred_metrics": ["RSI", "MACD", "Volume", "BollingerBands"],
-        "horizon": "days to weeks",
-    },
-}
+# One ticker = any run of characters other than commas/whitespace
+_TICKER_RE = re.compile(r"[^,\s]+")
 
-SCHEDULE_PRESETS = {
-    "Daily (Mon-Fri 18:00)": "0 18 * * 1-5",
-    "Weekly (Sunday 20:00)": "0 20 * * 0",
-    "Monthly (1st, 20:00)": "0 20 1 * *",
-}
 
-DEFAULT_WATCHLISTS = {
-    "core_satellite": "SPY, QQQ, VTI, AAPL, MSFT, GOOGL, AMZN, NVDA, BRK-B, JPM",
-    "value_investing": "BRK-B, JPM, JNJ, PG, KO, VZ, XOM, CVX, WMT, BAC",
-    "momentum": "NVDA, AMD, TSLA, SMCI, META, PLTR, ARM, CRWD, PANW, SQ",
-}
+def _parse_tickers(s: str) -> list[str]:
+    """Split a comma-separated ticker string into uppercase symbols."""
+    return [m.group(0).upper() for m in _TICKER_RE.finditer(s)]
 
 
 st.title("Account Management")
 
 config = load_config(fallback={"defaults": {"initial_budget": 10000, "currency": "USD"}, "accounts": {}})
 accounts = config.get("accounts", {})
+# Fingerprint of the config as loaded this run; edits below are compared against it
+loaded_digest = config_digest(config)
 
 # Fetch available models
+_DEFAULT_MODELS = ["Qwen3-Next", "Nemotron", "Miro_Thinker", "Mistral3_2"]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_models() -> list[str]:
+    try:
+        return LLMClient().list_models() or []
+    except Exception:
+        return []
+
+
 st.sidebar.subheader("Available Models")
-try:
-    llm = LLMClient()
-    available_models = llm.list_models()
-    if available_models:
-        for m in available_models:
-            st.sidebar.write(f"- {m}")
-    else:
-        available_models = ["Qwen3-Next", "Nemotron", "Miro_Thinker", "Mistral3_2"]
-        st.sidebar.warning("Could not fetch models. Using defaults.")
-except Exception:
-    available_models = ["Qwen3-Next", "Nemotron", "Miro_Thinker", "Mistral3_2"]
-    st.sidebar.warning("LLM not reachable. Using default model list.")
+if st.sidebar.button("Refresh models", key="refresh_models"):
+    _list_models.clear()
+available_models = _list_models()
+if available_models:
+    for m in available_models:
+        st.sidebar.write(f"- {m}")
+else:
+    available_models = _DEFAULT_MODELS
+    st.sidebar.warning("Could not fetch models. Using defaults.")
 
 # Existing accounts
 st.subheader("Existing Accounts")
 
 if not accounts:
     st.info("No accounts configured yet. Create one below.")
+else:
+    st.caption("Edit model or watchlist in place; delete a row to remove the account. Changes are saved together.")
+    accounts_df = pd.DataFrame.from_records(
+        [
+            {
+                "key": key,
+                "name": acct.get("name", key),
+                "model": acct.get("model"),
+                "fallback_model": acct.get("fallback_model"),
+                "cron": acct.get("cron"),
+                "strategy": acct.get("strategy"),
+                "watchlist": ", ".join(acct.get("watchlist", [])),
+                "ghostfolio_account_id": acct.get("ghostfolio_account_id", "TBD"),
+            }
+            for key, acct in accounts.items()
+        ],
+        index="key",
+    )
+    model_options = available_models + sorted(
+        {m for m in accounts_df["model"].dropna() if m not in available_models}
+    )
+    edited = st.data_editor(
+        accounts_df,
+        column_config={
+            "_index": st.column_config.TextColumn("Key", disabled=True),
+            "name": st.column_config.TextColumn("Name", disabled=True),
+            "model": st.column_config.SelectboxColumn("Model", options=model_options),
+            "fallback_model": st.column_config.TextColumn("Fallback", disabled=True),
+            "cron": st.column_config.TextColumn("Schedule", disabled=True),
+            "strategy": st.column_config.TextColumn("Strategy", disabled=True),
+            "watchlist": st.column_config.TextColumn("Watchlist (comma-separated)"),
+            "ghostfolio_account_id": st.column_config.TextColumn("Ghostfolio ID", disabled=True),
+        },
+        num_rows="dynamic",
+        use_container_width=True,
+        key="accounts_editor",
+    )
 
-for key, acct in accounts.items():
-    name = acct.get("name", key)
-    with st.expander(f"{name} ({key})", expanded=False):
-        col1, col2 = st.columns([4, 1])
-        with col1:
-            st.write(f"**Ghostfolio ID:** `{acct.get('ghostfolio_account_id', 'TBD')}`")
-            st.write(f"**Model:** {acct.get('model')} | **Fallback:** {acct.get('fallback_model')}")
-            st.write(f"**Schedule:** `{acct.get('cron')}` | **Strategy:** {acct.get('strategy')}")
-            st.write(f"**Watchlist:** {', '.join(acct.get('watchlist', []))}")
-
-            new_model = st.selectbox(
-                "Change Model",
-                options=available_models,
-                index=available_models.index(acct.get("model")) if acct.get("model") in available_models else 0,
-                key=f"model_{key}",
-            )
-            if new_model != acct.get("model"):
-                if st.button(f"Update Model to {new_model}", key=f"update_model_{key}"):
-                    config["accounts"][key]["model"] = new_model
-                    save_config(config)
-                    st.success(f"Model updated to {new_model}")
-                    st.rerun()
-
-            new_watchlist = st.text_input(
-                "Watchlist (comma-separated)",
-                value=", ".join(acct.get("watchlist", [])),
-                key=f"watchlist_{key}",
-            )
-            parsed_watchlist = [s.strip().upper() for s in new_watchlist.split(",") if s.strip()]
-            if parsed_watchlist != acct.get("watchlist", []):
-                if st.button("Update Watchlist", key=f"update_wl_{key}"):
-                    config["accounts"][key]["watchlist"] = parsed_watchlist
-                    save_config(config)
-                    st.success("Watchlist updated")
-                    st.rerun()
+    # Apply the editor state to config; rows added in the grid are ignored
+    # (new accounts need a Ghostfolio account, so they go through the form below).
+    removed = [key for key in accounts if key not in edited.index]
+    for key in removed:
+        del config["accounts"][key]
+    for key, row in edited.iterrows():
+        acct = config["accounts"].get(key)
+        if acct is None:
+            continue
+        if isinstance(row["model"], str) and row["model"] != acct.get("model"):
+            acct["model"] = row["model"]
+        watchlist = _parse_tickers(row["watchlist"] if isinstance(row["watchlist"], str) else "")
+        if watchlist != acct.get("watchlist", []):
+            acct["watchlist"] = watchlist
 
-        with col2:
-            if st.button("Delete", key=f"del_{key}", type="secondary"):
-                del config["accounts"][key]
-                save_config(config)
-                st.warning(f"Account {name} removed from config")
-                st.rerun()
+    if removed:
+        st.warning(f"Will remove from config: {', '.join(removed)}")
+    if st.button("Save Changes", type="primary", key="save_accounts"):
+        if save_config_if_dirty(config, loaded_digest):
+            st.session_state.pop("accounts_editor", None)
+            st.rerun()
+        else:
+            st.info("No changes to save.")
 
 st.divider()
 
@@ -239,9 +241,9 @@ with st.form("new_account"):
     submitted = st.form_submit_button("Create Account", type="primary")
 
     if submitted and name and key:
-        watchlist = [s.strip().upper() for s in watchlist_str.split(",") if s.strip()]
+        watchlist = _parse_tickers(watchlist_str)
         if not watchlist:
-            watchlist = [s.strip().upper() for s in DEFAULT_WATCHLISTS.get(strategy, "").split(",") if s.strip()]
+            watchlist = _parse_tickers(DEFAULT_WATCHLISTS.get(strategy, ""))
 
         risk_profile = {
             "max_position_pct": max_pos,
@@ -253,7 +255,7 @@ with st.form("new_account"):
         }
 
         try:
-            mgr = AccountManager(config_path=str(CONFIG_PATH))
+            mgr = AccountManager(config_path=CONFIG_PATH_STR)
             gf_id = mgr.add_account(
                 key=key,
                 name=name,
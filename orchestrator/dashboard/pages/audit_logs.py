@@ -1,43 +1,76 @@
 """Audit logs page: full prompt/response viewer with filters."""
 
+import orjson
+import pandas as pd
 import streamlit as st
-import json
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from src.audit_logger import AuditLogger
+from dashboard.components.audit_db import auditor
 from dashboard.config_utils import load_config
 
 
-st.title("Audit Logs")
+@st.cache_data(ttl=60, show_spinner=False)
+def _recent_logs(acct_key: str | None, limit: int) -> list[dict]:
+    """Recent log rows with ``timestamp`` parsed once into a pandas Timestamp (NaT if absent)."""
+    logs = auditor().get_recent_logs(account_key=acct_key, limit=limit)
+    parsed = pd.to_datetime(
+        [log.get("timestamp") for log in logs], format="ISO8601", errors="coerce", cache=True,
+    )
+    for log, ts in zip(logs, parsed):
+        log["timestamp"] = ts
+    return logs
 
-config = load_config()
-accounts = config.get("accounts", {})
-audit = AuditLogger()
 
-# Filters
-col1, col2 = st.columns(2)
-with col1:
-    account_filter = st.selectbox(
-        "Filter by Account",
-        options=["All"] + list(accounts.keys()),
-        format_func=lambda k: "All Accounts" if k == "All" else accounts.get(k, {}).get("name", k),
-    )
-with col2:
-    limit = st.slider("Max entries", 5, 50, 20)
+MAX_MESSAGE_CHARS = 3000
 
-# Fetch logs
-acct_key = None if account_filter == "All" else account_filter
-logs = audit.get_recent_logs(account_key=acct_key, limit=limit)
 
-if not logs:
-    st.info("No audit logs found.")
-    st.stop()
+@st.cache_data(ttl=300, show_spinner=False)
+def _log_detail(log_file: str) -> dict | None:
+    """Full log with prompt messages pre-truncated to what the page displays."""
+    detail = auditor().get_log_detail(log_file)
+    if detail:
+        for pass_key in ("pass1", "pass2"):
+            for msg in (detail.get(pass_key) or {}).get("messages") or []:
+                if isinstance(msg, dict) and isinstance(msg.get("content"), str):
+                    msg["content"] = msg["content"][:MAX_MESSAGE_CHARS]
+    return detail
 
-for log in logs:
-    ts = log.get("timestamp", "")[:16]
+
+MAX_JSON_BYTES = 64_000
+
+
+def _render_json_safely(obj, key: str, max_bytes: int = MAX_JSON_BYTES) -> None:
+    """st.json for small payloads; truncated text plus a download button for large ones."""
+    blob = orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    if len(blob) < max_bytes:
+        st.json(obj)
+        return
+    st.download_button(
+        "Download full JSON", blob, file_name=f"{key}.json", key=f"dl_{key}", on_click="ignore",
+    )
+    st.code(blob[:max_bytes].decode("utf-8", "replace"), language="json")
+
+
+def _messages_markdown(messages: list[dict]) -> str:
+    """All prompt messages of a pass as one markdown block (one element instead of 2 per message)."""
+    parts = []
+    for msg in messages:
+        content = msg.get("content", "")[:MAX_MESSAGE_CHARS]
+        fence = "```"
+        while fence in content:
+            fence += "`"
+        parts.append(f"**{msg.get('role', 'unknown')}:**\n\n{fence}\n{content}\n{fence}\n")
+    return "\n".join(parts)
+
+
+@st.fragment
+def _render_log(log: dict) -> None:
+    """One log entry; its "Show Full Log" button reruns only this fragment."""
+    ts = log["timestamp"]
+    ts = "" if pd.isna(ts) else f"{ts:%Y-%m-%d %H:%M}"
     acct_name = log.get("account_name", "Unknown")
     model = log.get("model", "N/A")
     success = log.get("success", 1)
@@ -67,31 +100,28 @@ for log in logs:
         # Full log detail
         log_file = log.get("log_file")
         if log_file and st.button(f"Show Full Log", key=f"full_{log_file}"):
-            detail = audit.get_log_detail(log_file)
+            detail = _log_detail(log_file)
             if detail:
+                stem = Path(log_file).stem
                 # Pass 1
                 st.subheader("Pass 1: Analysis")
                 p1 = detail.get("pass1", {})
                 if p1.get("messages"):
                     with st.expander("Pass 1 Prompt"):
-                        for msg in p1["messages"]:
-                            st.markdown(f"**{msg.get('role', 'unknown')}:**")
-                            st.code(msg.get("content", "")[:3000], language=None)
+                        st.markdown(_messages_markdown(p1["messages"]))
                 if p1.get("response"):
                     with st.expander("Pass 1 Response"):
-                        st.json(p1["response"])
+                        _render_json_safely(p1["response"], f"{stem}_pass1")
 
                 # Pass 2
                 st.subheader("Pass 2: Decision")
                 p2 = detail.get("pass2", {})
                 if p2.get("messages"):
                     with st.expander("Pass 2 Prompt"):
-                        for msg in p2["messages"]:
-                            st.markdown(f"**{msg.get('role', 'unknown')}:**")
-                            st.code(msg.get("content", "")[:3000], language=None)
+                        st.markdown(_messages_markdown(p2["messages"]))
                 if p2.get("response"):
                     with st.expander("Pass 2 Response"):
-                        st.json(p2["response"])
+                        _render_json_safely(p2["response"], f"{stem}_pass2")
 
                 # Risk Manager
                 rm = detail.get("risk_manager", {})
@@ -106,16 +136,44 @@ for log in logs:
                 trades = detail.get("executed_trades", [])
                 if trades:
                     st.subheader("Executed Trades")
-                    st.json(trades)
+                    _render_json_safely(trades, f"{stem}_trades")
 
                 # Portfolio before/after
                 st.subheader("Portfolio Snapshot")
                 pcol1, pcol2 = st.columns(2)
                 with pcol1:
                     st.write("**Before:**")
-                    st.json(detail.get("portfolio_before"))
+                    _render_json_safely(detail.get("portfolio_before"), f"{stem}_before")
                 with pcol2:
                     st.write("**After:**")
-                    st.json(detail.get("portfolio_after"))
+                    _render_json_safely(detail.get("portfolio_after"), f"{stem}_after")
             else:
                 st.error(f"Could not load log file: {log_file}")
+
+
+st.title("Audit Logs")
+
+config = load_config()
+accounts = config.get("accounts", {})
+
+# Filters
+col1, col2 = st.columns(2)
+with col1:
+    account_filter = st.selectbox(
+        "Filter by Account",
+        options=["All"] + list(accounts.keys()),
+        format_func=lambda k: "All Accounts" if k == "All" else accounts.get(k, {}).get("name", k),
+    )
+with col2:
+    limit = st.slider("Max entries", 5, 50, 20)
+
+# Fetch logs
+acct_key = None if account_filter == "All" else account_filter
+logs = _recent_logs(acct_key, limit)
+
+if not logs:
+    st.info("No audit logs found.")
+    st.stop()
+
+for log in logs:
+    _render_log(log)
@@ -2,20 +2,57 @@
 
 from __future__ import annotations
 
+import os
+import pickle
 import sys
+import tempfile
 from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 # Add orchestrator root to path so src.* imports resolve
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from dashboard.config_utils import load_config
+from dashboard.config_utils import accounts_by_strategy, config_digest, load_config
 from src.backtest.runner import BacktestResult, run_backtest
 from src.llm_client import LLMClient
 
+
+# Clean runs, pickled by cache key; survives restarts like the old disk cache
+_CACHE_DIR = Path("data/backtest_cache")
+
+
+def _cache_path(account_cfg: dict, start: str, end: str, initial_cash: float, llm_base_url: str) -> Path:
+    """Cache file for one set of run inputs (full account config included)."""
+    key = config_digest({
+        "account": account_cfg, "start": start, "end": end,
+        "initial_cash": initial_cash, "llm_base_url": llm_base_url,
+    })
+    return _CACHE_DIR / f"{key.hex()}.pkl"
+
+
+def _load_cached(path: Path) -> BacktestResult | None:
+    """Return the stored result, or None if missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:  # missing, truncated, or pickled by an older BacktestResult
+        return None
+
+
+def _store_cached(path: Path, result: BacktestResult) -> None:
+    """Persist a clean result atomically; failed runs are never stored."""
+    if result.error or any(d.get("error") for d in result.decisions):
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, path)
+
+
 st.title("Backtesting / Historical Simulation")
 st.caption(
     "Simulate how the LLM would have traded on historical market data. "
@@ -23,14 +60,10 @@ st.caption(
 )
 
 config = load_config()
-accounts = config.get("accounts", {})
 defaults = config.get("defaults", {})
 
 # Filter out options-spreads accounts (not supported for backtesting)
-eligible = {
-    k: v for k, v in accounts.items()
-    if v.get("strategy", "") != "vertical_spreads"
-}
+eligible = accounts_by_strategy("vertical_spreads", include=False)
 
 if not eligible:
     st.warning("No eligible accounts found (vertical_spreads accounts are excluded).")
@@ -88,39 +121,53 @@ if start_date >= end_date:
 # Run button
 # ---------------------------------------------------------------------------
 run_btn = st.button("▶ Run Simulation", type="primary", use_container_width=True)
+force_rerun = st.checkbox(
+    "Force re-run",
+    help="Ignore cached results for identical settings and query the LLM again.",
+)
 
 if run_btn:
     st.session_state.pop("backtest_result", None)  # Clear previous result
-
-    progress_bar = st.progress(0.0, text="Initialising…")
-    status_text = st.empty()
-
-    def on_progress(week_num: int, total_weeks: int, current_date: str) -> None:
-        pct = week_num / total_weeks
-        progress_bar.progress(pct, text=f"Week {week_num}/{total_weeks} — {current_date}")
-        status_text.text(f"Running week {week_num} of {total_weeks} ({current_date})…")
-
     llm_base_url = defaults.get("llm_base_url", "http://192.168.0.169:8080/v1")
-    llm = LLMClient(base_url=llm_base_url)
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+    cache_file = _cache_path(account_cfg, start_str, end_str, float(initial_capital), llm_base_url)
+    result = None if force_rerun else _load_cached(cache_file)
 
-    try:
-        result = run_backtest(
-            account_config=account_cfg,
-            start_date=start_date.strftime("%Y-%m-%d"),
-            end_date=end_date.strftime("%Y-%m-%d"),
-            llm_client=llm,
-            initial_cash=float(initial_capital),
-            on_progress=on_progress,
-        )
+    if result is not None:
         st.session_state["backtest_result"] = result
-        progress_bar.progress(1.0, text="Simulation complete")
-        status_text.empty()
-        if result.error:
-            st.error(f"Simulation ended with error: {result.error}")
-    except Exception as exc:
-        progress_bar.empty()
-        status_text.empty()
-        st.error(f"Simulation failed: {exc}")
+        st.caption("Loaded cached result for these settings. Tick “Force re-run” to query the LLM again.")
+    else:
+        progress_bar = st.progress(0.0, text="Initialising…")
+        status_text = st.empty()
+
+        def on_progress(week_num: int, total_weeks: int, current_date: str) -> None:
+            pct = week_num / total_weeks
+            progress_bar.progress(pct, text=f"Week {week_num}/{total_weeks} — {current_date}")
+            status_text.text(f"Running week {week_num} of {total_weeks} ({current_date})…")
+
+        try:
+            result = run_backtest(
+                account_config=account_cfg,
+                start_date=start_str,
+                end_date=end_str,
+                llm_client=LLMClient(base_url=llm_base_url),
+                initial_cash=float(initial_capital),
+                on_progress=on_progress,
+            )
+        except Exception as exc:
+            progress_bar.empty()
+            status_text.empty()
+            st.error(f"Simulation failed: {exc}")
+        if result is not None:
+            _store_cached(cache_file, result)
+            st.session_state["backtest_result"] = result
+            progress_bar.progress(1.0, text="Simulation complete")
+            status_text.empty()
+            if result.error:
+                st.error(f"Simulation ended with error: {result.error}")
+            elif any(d.get("error") for d in result.decisions):
+                st.warning("Some weeks failed to get an LLM decision; this run was not cached.")
 
 # ---------------------------------------------------------------------------
 # Results section
@@ -149,20 +196,20 @@ if result.snapshots:
     st.subheader("Performance Chart")
 
     snap_df = pd.DataFrame(result.snapshots)
-    snap_df["date"] = pd.to_datetime(snap_df["date"])
+    snap_df["date"] = pd.to_datetime(snap_df["date"], format="%Y-%m-%d", cache=True)
     snap_df = snap_df.set_index("date")
 
     # Build SPY benchmark curve from initial_capital
     if result.benchmark_return_pct != 0 and len(snap_df) > 1:
         # Linear interpolation of SPY growth as a proxy
-        n = len(snap_df)
-        spy_growth = [(result.benchmark_return_pct / 100) * i / (n - 1) for i in range(n)]
-        snap_df["spy_value"] = [initial_capital * (1 + g) for g in spy_growth]
+        spy_growth = np.linspace(0.0, result.benchmark_return_pct / 100, len(snap_df))
+        snap_df["spy_value"] = initial_capital * (1.0 + spy_growth)
     else:
         snap_df["spy_value"] = initial_capital
 
-    chart_df = snap_df[["total_value", "spy_value"]].rename(
-        columns={"total_value": "Portfolio", "spy_value": "SPY Benchmark"}
+    chart_df = pd.DataFrame(
+        {"Portfolio": snap_df["total_value"].to_numpy(), "SPY Benchmark": snap_df["spy_value"].to_numpy()},
+        index=snap_df.index,
     )
     st.line_chart(chart_df)
 
@@ -172,45 +219,60 @@ if result.snapshots:
 st.subheader("Weekly Decisions")
 
 if result.decisions:
-    rows = []
-    for d in result.decisions:
-        actions_str = ", ".join(
-            f"{a['type']} {a['symbol']}" for a in d.get("actions", [])
-        ) or "HOLD"
-        risk_mods_str = "; ".join(d.get("risk_mods", []))[:80] if d.get("risk_mods") else "—"
-        snap = next((s for s in result.snapshots if s["date"] == d["date"]), {})
-        rows.append({
-            "Week": d["week_num"],
-            "Date": d["date"],
-            "Regime": d.get("market_regime", "—"),
-            "Outlook": d.get("outlook", "—"),
-            "Conf": f"{d.get('confidence', 0):.2f}",
-            "Actions": actions_str,
-            "Risk mods": risk_mods_str,
-            "Portfolio $": f"${snap.get('total_value', 0):,.0f}",
-            "P/L %": f"{snap.get('pl_pct', 0):+.1f}%",
-        })
-    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    snap_by_date = {s["date"]: s for s in result.snapshots}
+    decisions = result.decisions
+    snaps = [snap_by_date.get(d["date"], {}) for d in decisions]
+    decisions_df = pd.DataFrame({
+        "Week": [d["week_num"] for d in decisions],
+        "Date": [d["date"] for d in decisions],
+        "Regime": [d.get("market_regime", "—") for d in decisions],
+        "Outlook": [d.get("outlook", "—") for d in decisions],
+        "Conf": [d.get("confidence", 0) for d in decisions],
+        "Actions": [
+            ", ".join(f"{a['type']} {a['symbol']}" for a in d.get("actions", [])) or "HOLD"
+            for d in decisions
+        ],
+        "Risk mods": [
+            "; ".join(d["risk_mods"])[:80] if d.get("risk_mods") else "—" for d in decisions
+        ],
+        "Portfolio $": [snap.get("total_value", 0) for snap in snaps],
+        "P/L %": [snap.get("pl_pct", 0) for snap in snaps],
+    })
+    st.dataframe(
+        decisions_df.style.format({"Conf": "{:.2f}", "Portfolio $": "${:,.0f}", "P/L %": "{:+.1f}%"}),
+        use_container_width=True,
+        hide_index=True,
+    )
 
 # ---------------------------------------------------------------------------
 # Trade log
 # ---------------------------------------------------------------------------
 if result.trades:
     with st.expander(f"Trade Log ({len(result.trades)} trades)"):
-        trade_rows = [
-            {
-                "Date": t.date,
-                "Type": t.type,
-                "Symbol": t.symbol,
-                "Qty": round(t.quantity, 4),
-                "Price": f"${t.price:,.2f}",
-                "Total": f"${t.total:,.2f}",
-                "Avg Cost": f"${t.avg_cost:,.2f}" if t.type == "SELL" else "—",
-                "P/L": (
-                    f"{(t.price - t.avg_cost) / t.avg_cost * 100:+.1f}%"
-                    if t.type == "SELL" and t.avg_cost > 0 else "—"
-                ),
-            }
-            for t in result.trades
-        ]
-        st.dataframe(pd.DataFrame(trade_rows), use_container_width=True, hide_index=True)
+        trades_df = result.trades_df
+        prices = trades_df["price"].to_numpy()
+        avg_costs = trades_df["avg_cost"].to_numpy()
+        is_sell = (trades_df["type"] == "SELL").to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pl_pct = np.where(is_sell & (avg_costs > 0), (prices - avg_costs) / avg_costs * 100, np.nan)
+        trades_df = pd.DataFrame({
+            "Date": trades_df["date"],
+            "Type": trades_df["type"],
+            "Symbol": trades_df["symbol"],
+            "Qty": trades_df["quantity"].round(4),
+            "Price": prices,
+            "Total": trades_df["total"],
+            "Avg Cost": np.where(is_sell, avg_costs, np.nan),
+            "P/L": pl_pct,
+        })
+        st.dataframe(
+            trades_df.style.format(
+                {
+                    "Date": "{:%Y-%m-%d}", "Price": "${:,.2f}", "Total": "${:,.2f}",
+                    "Avg Cost": "${:,.2f}", "P/L": "{:+.1f}%",
+                },
+                na_rep="—",
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
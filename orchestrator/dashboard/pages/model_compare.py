@@ -7,16 +7,60 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from src.audit_logger import AuditLogger
 from dashboard.config_utils import load_config
 
 DB_PATH = Path("data/audit.db")
 
+MODEL_SQL = """
+    SELECT model,
+           COUNT(*) as total_cycles,
+           AVG(confidence) as avg_confidence,
+           SUM(actions_count) as total_actions,
+           SUM(forced_actions_count) as total_forced,
+           SUM(rejected_count) as total_rejected,
+           SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+           AVG(portfolio_pl_pct) as avg_pl_pct
+    FROM decision_log
+    GROUP BY model
+    ORDER BY total_cycles DESC
+"""
+
+ACCOUNT_SQL = """
+    SELECT account_name, model,
+           COUNT(*) as cycles,
+           AVG(confidence) as avg_conf,
+           AVG(portfolio_pl_pct) as avg_pl
+    FROM decision_log
+    GROUP BY account_name, model
+    ORDER BY account_name, model
+"""
+
+
+def _query(sql: str) -> list[dict]:
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(r) for r in conn.execute(sql).fetchall()]
+    finally:
+        conn.close()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _model_stats() -> list[dict]:
+    return _query(MODEL_SQL)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _account_stats() -> list[dict]:
+    return _query(ACCOUNT_SQL)
+
 
 st.title("Model Comparison")
+if st.button("Refresh", key="refresh_model_stats"):
+    _model_stats.clear()
+    _account_stats.clear()
 
 config = load_config()
-audit = AuditLogger()
 
 if not DB_PATH.exists():
     st.info("No data yet. Wait for decision cycles to run.")
@@ -24,23 +68,8 @@ if not DB_PATH.exists():
 
 # Model stats from logs
 try:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-
     # Per-model stats
-    model_stats = conn.execute("""
-        SELECT model,
-               COUNT(*) as total_cycles,
-               AVG(confidence) as avg_confidence,
-               SUM(actions_count) as total_actions,
-               SUM(forced_actions_count) as total_forced,
-               SUM(rejected_count) as total_rejected,
-               SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-               AVG(portfolio_pl_pct) as avg_pl_pct
-        FROM decision_log
-        GROUP BY model
-        ORDER BY total_cycles DESC
-    """).fetchall()
+    model_stats = _model_stats()
 
     if model_stats:
         st.subheader("Model Performance Summary")
@@ -64,15 +93,7 @@ try:
     st.divider()
     st.subheader("Per-Account History")
 
-    account_stats = conn.execute("""
-        SELECT account_name, model,
-               COUNT(*) as cycles,
-               AVG(confidence) as avg_conf,
-               AVG(portfolio_pl_pct) as avg_pl
-        FROM decision_log
-        GROUP BY account_name, model
-        ORDER BY account_name, model
-    """).fetchall()
+    account_stats = _account_stats()
 
     if account_stats:
         for stat in account_stats:
@@ -82,7 +103,5 @@ try:
                 f"avg confidence {stat['avg_conf']:.2f}" if stat['avg_conf'] else "",
                 f"avg P/L {stat['avg_pl']:+.2f}%" if stat['avg_pl'] is not None else "",
             )
-
-    conn.close()
 except Exception as e:
     st.error(f"Database error: {e}")
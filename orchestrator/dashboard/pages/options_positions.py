@@ -3,28 +3,25 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 from pathlib import Path
 import sys
 
+import altair as alt
+import numpy as np
+import orjson
+import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from dashboard.config_utils import load_config
+from dashboard.components.audit_db import DB_PATH, audit_db
+from dashboard.config_utils import accounts_by_strategy
 
 st.title("Wheel Strategy")
 
-config = load_config()
-accounts = config.get("accounts", {})
-
 # Find options accounts
-options_accounts = {
-    key: acct
-    for key, acct in accounts.items()
-    if acct.get("strategy") == "wheel"
-}
+options_accounts = accounts_by_strategy("wheel")
 
 if not options_accounts:
     st.warning("No wheel strategy accounts configured. Add an account with `strategy: wheel` in config.yaml.")
@@ -38,58 +35,93 @@ selected_key = st.selectbox(
 )
 acct = options_accounts[selected_key]
 
-DB_PATH = Path("data/audit.db")
-
-
-def _db_connect():
-    if not DB_PATH.exists():
-        return None
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+MAX_DTE = 60  # full-scale value of the DTE progress bar
 
 
 def _load_active(account_key: str) -> list[dict]:
-    conn = _db_connect()
-    if conn is None:
+    if not DB_PATH.exists():
         return []
     try:
-        rows = conn.execute(
-            """SELECT * FROM options_positions
-            WHERE account_key=? AND status='open'
-            ORDER BY expiration_date ASC""",
-            (account_key,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        with audit_db() as conn:
+            rows = conn.execute(
+                """SELECT * FROM options_positions
+                WHERE account_key=? AND status='open'
+                ORDER BY expiration_date ASC""",
+                (account_key,),
+            ).fetchall()
     except Exception:
         return []
-    finally:
-        conn.close()
+    positions = []
+    for r in rows:
+        pos = dict(r)
+        pos["greeks"] = _parse_greeks(pos.get("current_greeks"))
+        positions.append(pos)
+    return positions
 
 
-def _load_history(account_key: str, limit: int = 30) -> list[dict]:
-    conn = _db_connect()
-    if conn is None:
+def _load_history(account_key: str, limit: int = 30, offset: int = 0) -> list[dict]:
+    if not DB_PATH.exists():
         return []
     try:
-        rows = conn.execute(
-            """SELECT * FROM options_positions
-            WHERE account_key=? AND status IN ('closed','expired')
-            ORDER BY close_date DESC LIMIT ?""",
-            (account_key, limit),
-        ).fetchall()
+        with audit_db() as conn:
+            rows = conn.execute(
+                """SELECT * FROM options_positions
+                WHERE account_key=? AND status IN ('closed','expired')
+                ORDER BY close_date DESC LIMIT ? OFFSET ?""",
+                (account_key, limit, offset),
+            ).fetchall()
         return [dict(r) for r in rows]
     except Exception:
         return []
-    finally:
-        conn.close()
+
+
+def _pl_series(account_key: str) -> dict[str, np.ndarray]:
+    """Close date (datetime64) and realized P&L (float64) of every closed position, oldest first.
+
+    Read uncached, like the history page, so totals and page count match its rows.
+    """
+    rows = []
+    if DB_PATH.exists():
+        try:
+            with audit_db() as conn:
+                rows = conn.execute(
+                    """SELECT substr(close_date, 1, 10), COALESCE(realized_pl, 0)
+                    FROM options_positions
+                    WHERE account_key=? AND status IN ('closed','expired')
+                    ORDER BY close_date ASC""",
+                    (account_key,),
+                ).fetchall()
+        except Exception:
+            rows = []
+    return {
+        "close_date": pd.to_datetime(
+            [r[0] for r in rows], format="%Y-%m-%d", cache=True,
+        ).to_numpy(),
+        "realized_pl": np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows)),
+    }
+
+
+_GREEK_KEYS = ("net_delta", "net_theta", "net_vega", "net_gamma")
+
+
+def _greeks_totals(positions: list[dict]) -> dict[str, float]:
+    """Sum net Greeks over the already-parsed open positions, skipping missing/NaN values."""
+    return {
+        k: float(np.nansum([p["greeks"].get(k) or 0.0 for p in positions], dtype=np.float64))
+        for k in _GREEK_KEYS
+    }
 
 
 def _parse_greeks(raw) -> dict:
     if isinstance(raw, str):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+        # positions.py stores greeks with json.dumps, which may write NaN literals
         try:
             return json.loads(raw)
-        except Exception:
+        except ValueError:
             return {}
     return raw if isinstance(raw, dict) else {}
 
@@ -100,10 +132,11 @@ active = _load_active(selected_key)
 
 st.subheader("Portfolio Greeks")
 
-total_delta = sum(_parse_greeks(p.get("current_greeks")).get("net_delta", 0) for p in active)
-total_theta = sum(_parse_greeks(p.get("current_greeks")).get("net_theta", 0) for p in active)
-total_vega = sum(_parse_greeks(p.get("current_greeks")).get("net_vega", 0) for p in active)
-total_gamma = sum(_parse_greeks(p.get("current_greeks")).get("net_gamma", 0) for p in active)
+greeks_totals = _greeks_totals(active)
+total_delta = greeks_totals["net_delta"]
+total_theta = greeks_totals["net_theta"]
+total_vega = greeks_totals["net_vega"]
+total_gamma = greeks_totals["net_gamma"]
 
 c1, c2, c3, c4, c5 = st.columns(5)
 with c1:
@@ -127,14 +160,19 @@ if not active:
     st.info("No open positions. Run a wheel cycle to let the AI sell CSPs or CCs.")
 else:
     for pos in active:
-        g = _parse_greeks(pos.get("current_greeks"))
+        g = pos["greeks"]
+        symbol, spread_type, expiration = pos["symbol"], pos["spread_type"], pos["expiration_date"]
         entry_debit = pos.get("entry_debit", 0)
-        current_value = pos.get("current_value")
         current_pl = pos.get("current_pl")
         max_profit = pos.get("max_profit", 0)
         max_loss = pos.get("max_loss", 0)
         dte = pos.get("dte")
         contracts = pos.get("contracts", 1)
+        buy_strike = pos.get("buy_strike") or 0.0
+        sell_strike = pos.get("sell_strike") or 0.0
+        buy_type = (pos.get("buy_option_type") or "").upper()
+        sell_type = (pos.get("sell_option_type") or "").upper()
+        delta, theta, vega = g.get("net_delta", 0), g.get("net_theta", 0), g.get("net_vega", 0)
 
         # P&L strings
         pl_str = f"${current_pl:+,.2f}" if current_pl is not None else "N/A"
@@ -144,17 +182,12 @@ else:
         else:
             pl_pct_str = ""
 
-        # Color based on DTE urgency
-        dte_color = "red" if (dte or 99) <= 7 else ("orange" if (dte or 99) <= 14 else "green")
-
-        buy_strike = pos.get("buy_strike") or 0.0
-        sell_strike = pos.get("sell_strike") or 0.0
         is_naked = buy_strike == 0.0  # CSP / CC: single-leg, no buy side
         strikes_str = str(sell_strike) if is_naked else f"{buy_strike}/{sell_strike}"
         header = (
-            f"{pos.get('symbol')} {pos.get('spread_type')} "
+            f"{symbol} {spread_type} "
             f"{strikes_str} "
-            f"| exp {pos.get('expiration_date')} "
+            f"| exp {expiration} "
             f"| DTE: {dte}"
         )
 
@@ -172,18 +205,16 @@ else:
                     f"${max_profit:.2f} / ${max_loss:.2f}",
                 )
             with col3:
-                st.metric("Delta", f"{g.get('net_delta', 0):+.2f}")
-                st.metric("Theta/day", f"${g.get('net_theta', 0):+.2f}")
+                st.metric("Delta", f"{delta:+.2f}")
+                st.metric("Theta/day", f"${theta:+.2f}")
             with col4:
-                st.metric("Vega/1%IV", f"${g.get('net_vega', 0):+.2f}")
+                st.metric("Vega/1%IV", f"${vega:+.2f}")
                 st.metric("Contracts", contracts)
 
-            sell_type = (pos.get("sell_option_type") or "").upper()
             credit = -entry_debit  # entry_debit < 0 for CSP/credit trades
             if is_naked:
                 leg_str = f"Sell: {sell_strike} {sell_type} @ ${credit:.2f} credit"
             else:
-                buy_type = (pos.get("buy_option_type") or "").upper()
                 leg_str = (
                     f"Buy: {buy_strike} {buy_type} | "
                     f"Sell: {sell_strike} {sell_type} | "
@@ -192,10 +223,9 @@ else:
             st.caption(f"{leg_str} | ID: {pos.get('id')}")
 
             # DTE progress bar
-            max_dte = 60
             dte_val = dte or 0
             st.progress(
-                max(0.0, min(1.0, dte_val / max_dte)),
+                max(0.0, min(1.0, dte_val / MAX_DTE)),
                 text=f"DTE: {dte_val} days remaining",
             )
 
@@ -205,12 +235,21 @@ st.divider()
 
 st.subheader("Closed Positions — P&L History")
 
-history = _load_history(selected_key)
+pl_series = _pl_series(selected_key)
+total_closed = len(pl_series["close_date"])
 
-if not history:
+if not total_closed:
     st.info("No closed positions yet.")
 else:
-    # Summary table
+    # Summary table — one page of rows fetched with LIMIT/OFFSET
+    pcol1, pcol2 = st.columns(2)
+    with pcol1:
+        page_size = st.selectbox("Rows per page", [10, 30, 100], index=1, key="history_page_size")
+    with pcol2:
+        n_pages = -(-total_closed // page_size)
+        page = st.number_input(f"Page (of {n_pages})", 1, n_pages, 1, key="history_page")
+    history = _load_history(selected_key, limit=page_size, offset=(page - 1) * page_size)
+
     rows = []
     for p in history:
         rows.append({
@@ -225,54 +264,50 @@ else:
             "P&L": f"${p.get('realized_pl', 0):+.2f}" if p.get("realized_pl") is not None else "N/A",
         })
 
-    import pandas as pd
     df = pd.DataFrame(rows)
     st.dataframe(df, use_container_width=True, hide_index=True)
 
-    # Cumulative P&L chart
-    pl_values = [p.get("realized_pl") or 0 for p in reversed(history)]
-    dates = [p.get("close_date", "")[:10] for p in reversed(history)]
-    cumulative = []
-    running = 0.0
-    for v in pl_values:
-        running += v
-        cumulative.append(running)
-
-    if cumulative:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=cumulative,
-            mode="lines+markers",
-            name="Cumulative P&L",
-            line=dict(color="green" if cumulative[-1] >= 0 else "red", width=2),
-            fill="tozeroy",
-            fillcolor="rgba(0, 200, 0, 0.1)" if cumulative[-1] >= 0 else "rgba(200, 0, 0, 0.1)",
-        ))
-        fig.add_hline(y=0, line_dash="dash", line_color="gray")
-        fig.update_layout(
-            title="Cumulative Realized P&L — Wheel Strategy",
-            xaxis_title="Close Date",
-            yaxis_title="Cumulative P&L ($)",
-            height=350,
-            margin=dict(l=0, r=0, t=40, b=0),
+    # Cumulative P&L chart over the full closed history
+    dates = pl_series["close_date"]
+    cumulative = np.cumsum(pl_series["realized_pl"])
+
+    if len(cumulative):
+        color = "green" if cumulative[-1] >= 0 else "red"
+        pl_df = pd.DataFrame({"date": dates, "cum_pl": cumulative})
+        base = alt.Chart(pl_df).encode(
+            x=alt.X("date:T", title="Close Date"),
+            y=alt.Y("cum_pl:Q", title="Cumulative P&L ($)"),
         )
-        st.plotly_chart(fig, use_container_width=True)
+        zero_line = alt.Chart(pd.DataFrame({"y": [0]})).mark_rule(
+            color="gray", strokeDash=[4, 4],
+        ).encode(y="y:Q")
+        chart = (
+            base.mark_area(color=color, opacity=0.1)
+            + base.mark_line(color=color, point=True, strokeWidth=2)
+            + zero_line
+        ).properties(title="Cumulative Realized P&L — Wheel Strategy", height=350)
+        st.altair_chart(chart, use_container_width=True)
+
+    pl_values = [p.get("realized_pl") or 0 for p in reversed(history)]
 
-    # Per-trade P&L bar chart
+    # Per-trade P&L bar chart — the rows on the current page only
     if pl_values:
-        colors = ["green" if v >= 0 else "red" for v in pl_values]
+        pl_arr = np.fromiter(pl_values, dtype=np.float64, count=len(pl_values))
         labels = [f"{p.get('symbol')} {p.get('spread_type')[:2]}" for p in reversed(history)]
+        colors = np.where(pl_arr >= 0, "green", "red")
         fig2 = go.Figure(go.Bar(
             x=labels,
-            y=pl_values,
+            y=pl_arr,
             marker_color=colors,
-            text=[f"${v:+.0f}" for v in pl_values],
+            texttemplate="$%{y:+.0f}",
             textposition="outside",
         ))
         fig2.add_hline(y=0, line_dash="dash", line_color="gray")
         fig2.update_layout(
-            title="Per-Trade P&L",
+            title=(
+                f"Per-Trade P&L — page {page} of {n_pages}"
+                if n_pages > 1 else "Per-Trade P&L"
+            ),
             xaxis_title="Position",
             yaxis_title="Realized P&L ($)",
             height=300,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 import sqlite3
 from pathlib import Path
 import sys
@@ -12,19 +12,12 @@ import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from dashboard.config_utils import load_config
+from dashboard.config_utils import accounts_by_strategy
 
 st.title("Options Spreads")
 
-config = load_config()
-accounts = config.get("accounts", {})
-
 # Find spread accounts
-spread_accounts = {
-    key: acct
-    for key, acct in accounts.items()
-    if acct.get("strategy") == "vertical_spreads"
-}
+spread_accounts = accounts_by_strategy("vertical_spreads")
 
 if not spread_accounts:
     st.warning("No options spread accounts configured. Add an account with `strategy: vertical_spreads` in config.yaml.")
@@ -88,7 +81,7 @@ def _load_history(account_key: str, limit: int = 30) -> list[dict]:
 def _parse_greeks(raw) -> dict:
     if isinstance(raw, str):
         try:
-            return json.loads(raw)
+            return orjson.loads(raw)
         except Exception:
             return {}
     return raw if isinstance(raw, dict) else {}
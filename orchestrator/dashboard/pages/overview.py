@@ -1,97 +1,18 @@
 """Overview page: account cards, performance summary, next run times."""
 
 import streamlit as st
-from pathlib import Path
-from datetime import datetime, timezone
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from src.ghostfolio_client import GhostfolioClient
-from src.audit_logger import AuditLogger
+from dashboard.components.audit_db import auditor
 from dashboard.components.charts import render_performance_chart
-from dashboard.config_utils import load_config
-
-
-# ---------------------------------------------------------------------------
-# Schedule helpers
-# ---------------------------------------------------------------------------
-
-_DOW_ISO = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]  # 0=Mon … 6=Sun
-
-
-def _dow_label(dow_str: str) -> str:
-    """Convert APScheduler day_of_week field to readable label."""
-    dow_str = dow_str.strip()
-    if "-" in dow_str:
-        a, b = dow_str.split("-", 1)
-        return f"{_DOW_ISO[int(a)]}–{_DOW_ISO[int(b)]}"
-    if "," in dow_str:
-        return "/".join(_DOW_ISO[int(d)] for d in dow_str.split(","))
-    if dow_str == "*":
-        return "daily"
-    return _DOW_ISO[int(dow_str)]
-
-
-def cron_to_human(cron: str) -> str:
-    """Convert a crontab string to a short human-readable description."""
-    if not cron:
-        return "no schedule"
-    parts = cron.split()
-    if len(parts) != 5:
-        return cron
+from dashboard.config_utils import config_mtime_ns, load_config
+from dashboard.schedule_utils import cron_to_human, next_run_time
 
-    minute, hour, dom, month, dow = parts
 
-    # Build time string
-    if "," in minute:
-        mins = ", ".join(f":{m.zfill(2)}" for m in minute.split(","))
-        time_str = f"{hour}:xx at {mins}"
-    elif minute == "*/30":
-        time_str = f"every 30 min"
-    else:
-        time_str = f"{hour}:{minute.zfill(2)}"
-
-    # Build hour range for intraday
-    if "-" in hour:
-        h_start, h_end = hour.split("-")
-        time_str = f"{h_start}:00–{h_end}:59 every 30 min"
-        return f"{_dow_label(dow)} · {time_str} CET"
-
-    # Build frequency string
-    if dom != "*" and dom.isdigit():
-        freq = f"Monthly (day {dom})"
-    elif dow == "*":
-        freq = "Daily"
-    else:
-        freq = _dow_label(dow)
-
-    return f"{freq} · {time_str} CET"
-
-
-def next_run_time(cron: str) -> str:
-    """Return 'Next: Weekday Mon DD at HH:MM' using APScheduler."""
-    if not cron:
-        return ""
-    try:
-        from apscheduler.triggers.cron import CronTrigger
-        parts = cron.split()
-        if len(parts) != 5:
-            return ""
-        minute, hour, dom, month, dow = parts
-        trigger = CronTrigger(
-            minute=minute, hour=hour,
-            day=dom, month=month, day_of_week=dow,
-            timezone="Europe/Warsaw",
-        )
-        now = datetime.now(timezone.utc)
-        nxt = trigger.get_next_fire_time(None, now)
-        if nxt is None:
-            return ""
-        # Format as "Mon 25 Feb · 18:00"
-        return "Next: " + nxt.strftime("%a %d %b · %H:%M")
-    except Exception:
-        return ""
+@st.cache_resource
+def _gf_client() -> GhostfolioClient:
+    """One client per process: keeps its HTTP connection pool and JWT across reruns."""
+    return GhostfolioClient()
 
 
 config = load_config()
@@ -108,87 +29,128 @@ if not accounts:
 # P/L wrong. Instead we compute securities value ourselves:
 #   securities = Σ (per-account orders filtered by accountId) × current market prices
 # This requires one fetch each of list_accounts, list_orders, get_portfolio_holdings.
-_live_values: dict[str, dict] = {}
-_ghostfolio_ok = False
-try:
-    from src.ghostfolio_client import GhostfolioClient
-    _gf = GhostfolioClient()
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_live_values() -> dict[str, dict]:
+    """Return {ghostfolio_account_id: {"total", "cash"}}; raises if Ghostfolio is unreachable."""
+    gf = _gf_client()
+    live_values: dict[str, dict] = {}
 
     # ── 1. Account cash balances ───────────────────────────────────────────────
-    _acct_list = _gf.list_accounts()
-    if isinstance(_acct_list, dict):
-        _acct_list = _acct_list.get("accounts", [])
-    _cash_by_id: dict[str, float] = {
-        _a["id"]: float(_a.get("balance", 0) or 0)
-        for _a in _acct_list if isinstance(_a, dict) and _a.get("id")
+    acct_list = gf.list_accounts()
+    if isinstance(acct_list, dict):
+        acct_list = acct_list.get("accounts", [])
+    to_float = float  # local binding: these comprehensions run once per account/holding
+    cash_by_id: dict[str, float] = {
+        aid: to_float(a.get("balance", 0) or 0)
+        for a in acct_list if isinstance(a, dict) and (aid := a.get("id"))
     }
 
     # ── 2. Current market prices from holdings ────────────────────────────────
-    _holdings_raw = _gf.get_portfolio_holdings()
-    if isinstance(_holdings_raw, dict):
-        _holdings_raw = _holdings_raw.get("holdings", _holdings_raw)
-    _price_map: dict[str, float] = {}
-    _h_iter = _holdings_raw if isinstance(_holdings_raw, list) else (
-        _holdings_raw.values() if isinstance(_holdings_raw, dict) else []
+    holdings_raw = gf.get_portfolio_holdings()
+    if isinstance(holdings_raw, dict):
+        holdings_raw = holdings_raw.get("holdings", holdings_raw)
+    h_iter = holdings_raw if isinstance(holdings_raw, list) else (
+        holdings_raw.values() if isinstance(holdings_raw, dict) else []
     )
-    for _h in _h_iter:
-        if not isinstance(_h, dict):
-            continue
-        _sp = _h.get("SymbolProfile") or {}
-        _sym = _sp.get("symbol") or _h.get("symbol", "")
-        if _sym and len(_sym) <= 10:
-            _price_map[_sym] = float(_h.get("marketPrice", 0) or 0)
+    price_map: dict[str, float] = {
+        sym: to_float(h.get("marketPrice", 0) or 0)
+        for h in h_iter
+        if isinstance(h, dict)
+        and (sym := (h.get("SymbolProfile") or {}).get("symbol") or h.get("symbol", ""))
+        and len(sym) <= 10
+    }
 
     # ── 3. Per-account order quantities ──────────────────────────────────────
-    _all_orders = _gf.list_orders()
-    if isinstance(_all_orders, dict):
-        _all_orders = _all_orders.get("activities", [])
+    all_orders = gf.list_orders()
+    if isinstance(all_orders, dict):
+        all_orders = all_orders.get("activities", [])
 
     # Group orders by accountId
-    _orders_by_acct: dict[str, list] = {}
-    for _o in _all_orders:
-        _oid = _o.get("accountId", "")
-        if _oid:
-            _orders_by_acct.setdefault(_oid, []).append(_o)
+    orders_by_acct: dict[str, list] = {}
+    for o in all_orders:
+        oid = o.get("accountId", "")
+        if oid:
+            orders_by_acct.setdefault(oid, []).append(o)
 
     # ── 4. Compute per-account market value ──────────────────────────────────
-    for _aid, _cash in _cash_by_id.items():
-        _acct_orders = _orders_by_acct.get(_aid, [])
+    for aid, cash in cash_by_id.items():
+        acct_orders = orders_by_acct.get(aid, [])
 
         # Aggregate net qty per symbol (BUY adds, SELL reduces)
-        _agg: dict[str, dict] = {}
-        for _o in _acct_orders:
-            _sp = _o.get("SymbolProfile") or {}
-            _sym = _sp.get("symbol") or _o.get("symbol", "")
-            if not _sym:
+        agg: dict[str, dict] = {}
+        for o in acct_orders:
+            sp = o.get("SymbolProfile") or {}
+            sym = sp.get("symbol") or o.get("symbol", "")
+            if not sym:
                 continue
-            _qty = float(_o.get("quantity", 0) or 0)
-            _price = float(_o.get("unitPrice", 0) or 0)
-            _otype = (_o.get("type") or "").upper()
-            if _sym not in _agg:
-                _agg[_sym] = {"qty": 0.0, "avg_cost": 0.0}
-            if _otype == "BUY":
-                _total_cost = _agg[_sym]["avg_cost"] * _agg[_sym]["qty"] + _qty * _price
-                _agg[_sym]["qty"] += _qty
-                _agg[_sym]["avg_cost"] = _total_cost / _agg[_sym]["qty"] if _agg[_sym]["qty"] else 0
-            elif _otype == "SELL":
-                _agg[_sym]["qty"] = max(0.0, _agg[_sym]["qty"] - _qty)
-
-        _securities = sum(
-            _data["qty"] * (_price_map.get(_sym) or _data["avg_cost"])
-            for _sym, _data in _agg.items()
-            if _data["qty"] > 0.0001
+            qty = to_float(o.get("quantity", 0) or 0)
+            price = to_float(o.get("unitPrice", 0) or 0)
+            otype = (o.get("type") or "").upper()
+            if sym not in agg:
+                agg[sym] = {"qty": 0.0, "avg_cost": 0.0}
+            if otype == "BUY":
+                total_cost = agg[sym]["avg_cost"] * agg[sym]["qty"] + qty * price
+                agg[sym]["qty"] += qty
+                agg[sym]["avg_cost"] = total_cost / agg[sym]["qty"] if agg[sym]["qty"] else 0
+            elif otype == "SELL":
+                agg[sym]["qty"] = max(0.0, agg[sym]["qty"] - qty)
+
+        securities = sum(
+            data["qty"] * (price_map.get(sym) or data["avg_cost"])
+            for sym, data in agg.items()
+            if data["qty"] > 0.0001
         )
 
-        _live_values[_aid] = {"total": _securities + _cash, "cash": _cash}
+        live_values[aid] = {"total": securities + cash, "cash": cash}
+
+    return live_values
 
+
+try:
+    _live_values = _fetch_live_values()
     _ghostfolio_ok = True
-except Exception as _gf_err:
+except Exception:
     _ghostfolio_ok = False
     _live_values = {}  # discard any partial data — use audit log consistently
 
-# Account cards — grouped by strategy
-trading_accounts = {k: v for k, v in accounts.items() if v.get("cycle_type") != "research"}
+# Group accounts by strategy: display order, icon and label per group
+_GROUP_META: dict[str, tuple[str, str]] = {
+    "core_satellite": ("🏛️", "Core-Satellite"),
+    "value_investing": ("💎", "Value Investing"),
+    "momentum": ("🚀", "Momentum"),
+    "intraday": ("⚡", "Intraday Momentum"),
+    "wheel": ("🎡", "Wheel Strategy"),
+    "vertical_spreads": ("📈", "Options Spreads"),
+}
+CARDS_PER_ROW = 4  # wider groups wrap onto extra rows instead of squeezing columns
+
+
+def _group_accounts(accounts: dict[str, dict]) -> list[tuple[str, str, list[tuple[str, dict]]]]:
+    """[(icon, label, [(key, acct), ...]), ...] in display order."""
+    groups: dict[str, list[tuple[str, dict]]] = {}
+    for key, acct in accounts.items():
+        strategy = acct.get("strategy", "other")
+        # Separate intraday momentum from daily momentum
+        if strategy == "momentum" and acct.get("cycle_type") == "intraday":
+            strategy = "intraday"
+        groups.setdefault(strategy, []).append((key, acct))
+
+    return [
+        (icon, label, groups[strategy_key])
+        for strategy_key, (icon, label) in _GROUP_META.items()
+        if strategy_key in groups
+    ]
+
+
+# Account cards — grouped by strategy. The config rarely changes within a session,
+# so the filtered accounts and their grouping are kept in session_state until its mtime moves.
+_cfg_mtime = config_mtime_ns()
+if st.session_state.get("_overview_cfg_mtime") != _cfg_mtime or "_overview_groups" not in st.session_state:
+    _trading = {k: v for k, v in accounts.items() if v.get("cycle_type") != "research"}
+    st.session_state["_overview_trading"] = _trading
+    st.session_state["_overview_groups"] = _group_accounts(_trading)
+    st.session_state["_overview_cfg_mtime"] = _cfg_mtime
+trading_accounts = st.session_state["_overview_trading"]
 
 # Options strategies use audit DB for P/L (Ghostfolio can't price synthetic option assets)
 _OPTIONS_STRATEGIES = {"wheel", "vertical_spreads"}
@@ -246,102 +208,108 @@ with _metric_col:
 
 if not _ghostfolio_ok:
     st.error("Ghostfolio niedostępny — wartości kont mogą być nieaktualne (dane z ostatniego cyklu)")
+if st.button("🔄 Refresh", help="Re-fetch live account values from Ghostfolio"):
+    _fetch_live_values.clear()
+    st.rerun()
+
+audit = auditor()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _latest_per_account(keys: tuple[str, ...]) -> dict[str, dict]:
+    """Most recent decision log row for each account key (missing keys omitted)."""
+    return audit.latest_per_account(keys)
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _latest_decisions(limit: int = 10) -> list[dict]:
+    return audit.get_recent_logs(limit=limit)
+
+
+latest_map = _latest_per_account(tuple(trading_accounts))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _render_card_strings(
+    name: str,
+    value: float | None,
+    pl_pct: float | None,
+    initial_budget: float,
+    model: str,
+    human: str,
+    nxt: str,
+    regime: str,
+    success: bool,
+) -> dict:
+    """All display strings for one account card; unchanged cards skip the formatting."""
+    if value is not None:
+        value_str = f"${value:,.2f}"
+        delta_str = f"{pl_pct:+.2f}%" if pl_pct is not None else None
+    else:
+        value_str = f"${initial_budget:,.2f}"
+        delta_str = "New"
+    captions = [f"Model: **{model}**", f"🕐 {human}"]
+    if nxt:
+        captions.append(f"📅 {nxt}")
+    captions.append(f"Market: {regime}")
+    return {
+        "title": f"**{name}**",
+        "value_str": value_str,
+        "delta_str": delta_str,
+        # One caption element per card; markdown hard breaks keep one line per item
+        "caption": "  \n".join(captions),
+        "status_fn": "success" if success else "error",
+        "status_text": f"Status: {'OK' if success else 'ERROR'}",
+    }
 
-audit = AuditLogger()
-
-# Group accounts by strategy
-_STRATEGY_LABELS = {
-    "core_satellite": "Core-Satellite",
-    "value_investing": "Value Investing",
-    "momentum": "Momentum",
-    "wheel": "Wheel Strategy",
-    "vertical_spreads": "Options Spreads",
-}
-groups: dict[str, list[tuple[str, dict]]] = {}
-for key, acct in trading_accounts.items():
-    strategy = acct.get("strategy", "other")
-    # Separate intraday momentum from daily momentum
-    if strategy == "momentum" and acct.get("cycle_type") == "intraday":
-        strategy = "intraday"
-    groups.setdefault(strategy, []).append((key, acct))
-
-_GROUP_ORDER = ["core_satellite", "value_investing", "momentum", "intraday", "wheel", "vertical_spreads"]
-_GROUP_ICONS = {
-    "core_satellite": "🏛️",
-    "value_investing": "💎",
-    "momentum": "🚀",
-    "intraday": "⚡",
-    "wheel": "🎡",
-    "vertical_spreads": "📈",
-}
-
-for strategy_key in _GROUP_ORDER:
-    acct_list = groups.get(strategy_key)
-    if not acct_list:
-        continue
 
-    icon = _GROUP_ICONS.get(strategy_key, "📊")
-    label = _STRATEGY_LABELS.get(strategy_key, strategy_key.replace("_", " ").title())
-    if strategy_key == "intraday":
-        label = "Intraday Momentum"
+for icon, label, acct_list in st.session_state["_overview_groups"]:
     st.subheader(f"{icon} {label}")
 
-    cols = st.columns(len(acct_list))
-    for i, (key, acct) in enumerate(acct_list):
-        with cols[i]:
-            name = acct.get("name", key)
-            model = acct.get("model", "Unknown")
-            cron = acct.get("cron", "")
-
-            logs = audit.get_recent_logs(account_key=key, limit=1)
-            latest = logs[0] if logs else {}
-
-            last_regime = latest.get("market_regime", "N/A")
-            success = latest.get("success", 1)
-
-            acct_id = acct.get("ghostfolio_account_id", "")
-            live = _live_values.get(acct_id, {})
-            strategy = acct.get("strategy", "")
-            acct_budget = float(acct.get("initial_budget", initial_budget))
-            if live.get("total"):
-                # Use Ghostfolio balance for all accounts (options balance now correct after fix)
-                value = live["total"]
-                pl_pct = (value - acct_budget) / acct_budget * 100 if acct_budget else None
-            elif strategy in _OPTIONS_STRATEGIES:
-                # Ghostfolio unavailable — fall back to initial + realized P/L
-                realized_pl = _options_pl_cache.get(key, 0.0)
-                value = acct_budget + realized_pl
-                pl_pct = (realized_pl / acct_budget * 100) if acct_budget else None
-            else:
-                value = latest.get("portfolio_value")
-                pl_pct = latest.get("portfolio_pl_pct")
-
-            st.markdown(f"**{name}**")
-            if value is not None:
-                delta = f"{pl_pct:+.2f}%" if pl_pct is not None else None
-                st.metric("Portfolio Value", f"${value:,.2f}", delta=delta)
-            else:
-                st.metric("Portfolio Value", f"${initial_budget:,.2f}", delta="New")
-
-            st.caption(f"Model: **{model}**")
-            human = cron_to_human(cron)
-            nxt = next_run_time(cron)
-            st.caption(f"🕐 {human}")
-            if nxt:
-                st.caption(f"📅 {nxt}")
-            st.caption(f"Market: {last_regime}")
-
-            status = "OK" if success else "ERROR"
-            if success:
-                st.success(f"Status: {status}")
-            else:
-                st.error(f"Status: {status}")
+    for row_start in range(0, len(acct_list), CARDS_PER_ROW):
+        row = acct_list[row_start:row_start + CARDS_PER_ROW]
+        cols = st.columns(len(row))
+        for col, (key, acct) in zip(cols, row):
+            with col:
+                name = acct.get("name", key)
+                model = acct.get("model", "Unknown")
+                cron = acct.get("cron", "")
+
+                latest = latest_map.get(key, {})
+
+                last_regime = latest.get("market_regime", "N/A")
+                success = latest.get("success", 1)
+
+                acct_id = acct.get("ghostfolio_account_id", "")
+                live = _live_values.get(acct_id, {})
+                strategy = acct.get("strategy", "")
+                acct_budget = float(acct.get("initial_budget", initial_budget))
+                if live.get("total"):
+                    # Use Ghostfolio balance for all accounts (options balance now correct after fix)
+                    value = live["total"]
+                    pl_pct = (value - acct_budget) / acct_budget * 100 if acct_budget else None
+                elif strategy in _OPTIONS_STRATEGIES:
+                    # Ghostfolio unavailable — fall back to initial + realized P/L
+                    realized_pl = _options_pl_cache.get(key, 0.0)
+                    value = acct_budget + realized_pl
+                    pl_pct = (realized_pl / acct_budget * 100) if acct_budget else None
+                else:
+                    value = latest.get("portfolio_value")
+                    pl_pct = latest.get("portfolio_pl_pct")
+
+                card = _render_card_strings(
+                    name, value, pl_pct, initial_budget, model,
+                    cron_to_human(cron), next_run_time(cron), last_regime, bool(success),
+                )
+                st.markdown(card["title"])
+                st.metric("Portfolio Value", card["value_str"], delta=card["delta_str"])
+                st.caption(card["caption"])
+                getattr(st, card["status_fn"])(card["status_text"])
 
 st.divider()
 
 # Latest decisions
 st.subheader("Latest Decisions")
-all_logs = audit.get_recent_logs(limit=10)
+all_logs = _latest_decisions(10)
 
 if all_logs:
     for log in all_logs:
@@ -368,6 +336,11 @@ else:
 
 st.divider()
 
-# Performance chart placeholder
+# Performance chart — refreshes on its own timer, never on card/button reruns
+@st.fragment(run_every=60)
+def _perf_fragment() -> None:
+    render_performance_chart(config, audit)
+
+
 st.subheader("Performance Comparison")
-render_performance_chart(config, audit)
+_perf_fragment()
@@ -1,6 +1,7 @@
 """Daily Research Agent dashboard page."""
 
 import json
+import orjson
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -9,7 +10,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from dashboard.pages.overview import cron_to_human, next_run_time
+from dashboard.schedule_utils import cron_to_human, next_run_time
 from dashboard.config_utils import load_config
 
 st.title("Daily Research Agent")
@@ -18,13 +19,29 @@ st.title("Daily Research Agent")
 
 BRIEF_PATH = Path("data/daily_research.json")
 
-brief = None
-if BRIEF_PATH.exists():
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_brief(mtime_ns: int) -> dict | None:
+    """Parsed brief; keyed on mtime so a rewritten file is re-read."""
+    try:
+        raw = BRIEF_PATH.read_bytes()
+    except OSError:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        pass
+    # research_agent writes with json.dump, which may emit NaN literals
     try:
-        with open(BRIEF_PATH) as f:
-            brief = json.load(f)
-    except Exception:
-        brief = None
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+try:
+    brief = _load_brief(BRIEF_PATH.stat().st_mtime_ns)
+except FileNotFoundError:
+    brief = None
 
 config = load_config()
 research_cfg = config.get("accounts", {}).get("research", {})
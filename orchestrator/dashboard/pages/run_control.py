@@ -1,14 +1,50 @@
 """Run control page: manual trigger, dry-run, pause/resume, force sell all."""
 
+import multiprocessing
+import threading
 import streamlit as st
 from pathlib import Path
 import sys
-import subprocess
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from dashboard.config_utils import load_config
-from dashboard.pages.overview import cron_to_human, next_run_time
+from dashboard.schedule_utils import cron_to_human, next_run_time
+from src.main import run_once_captured, run_all_parallel
+
+# Same file `python -m src.main` reads by default (../config.yaml from the orchestrator dir)
+_ORCH_CONFIG = str(Path(__file__).resolve().parents[3] / "config.yaml")
+
+
+@st.cache_resource
+def _cycle_lock() -> threading.Lock:
+    """Shared by all sessions, so manual cycles (single or Run All) never overlap."""
+    return threading.Lock()
+
+
+_BUSY_MSG = "Another manual cycle is still running — try again when it finishes."
+
+
+def _run_cycle(key: str, dry_run: bool, timeout: int = 600) -> tuple[bool, str]:
+    """Run one account cycle in a child process; returns (ok, captured stdout or error tail).
+
+    The cycle's stdout capture stays inside the child, and the child is
+    terminated if it outlives ``timeout``.
+    """
+    lock = _cycle_lock()
+    if not lock.acquire(blocking=False):
+        return False, _BUSY_MSG
+    try:
+        # spawn, not fork: the Streamlit server is multi-threaded
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            job = pool.apply_async(run_once_captured, (key, dry_run, _ORCH_CONFIG, True))
+            return True, job.get(timeout=timeout)  # leaving the block terminates the child
+    except multiprocessing.TimeoutError:
+        return False, f"Cycle timed out after {timeout}s and was terminated."
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        lock.release()
 
 
 st.title("Run Control")
@@ -37,65 +73,79 @@ for key, acct in accounts.items():
     with col2:
         if st.button(f"Run Now", key=f"run_{key}"):
             with st.spinner(f"Running cycle for {name}..."):
-                result = subprocess.run(
-                    [sys.executable, "-m", "src.main", "--once", key],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(Path(__file__).resolve().parents[2]),
-                    timeout=600,
-                )
-                if result.returncode == 0:
+                ok, output = _run_cycle(key, dry_run=False)
+                if ok:
                     st.success(f"Cycle completed for {name}")
                 else:
-                    st.error(f"Cycle failed: {result.stderr[-500:]}")
+                    st.error(f"Cycle failed: {output[-500:]}")
 
     with col3:
         if st.button(f"Dry Run", key=f"dry_{key}"):
             with st.spinner(f"Dry run for {name}..."):
-                result = subprocess.run(
-                    [sys.executable, "-m", "src.main", "--once", key, "--dry-run"],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(Path(__file__).resolve().parents[2]),
-                    timeout=600,
-                )
-                if result.returncode == 0:
+                ok, output = _run_cycle(key, dry_run=True)
+                if ok:
                     st.success(f"Dry run completed for {name}")
-                    st.code(result.stdout[-2000:])
+                    st.code(output[-2000:])
                 else:
-                    st.error(f"Dry run failed: {result.stderr[-500:]}")
+                    st.error(f"Dry run failed: {output[-500:]}")
 
 st.divider()
 
 st.subheader("Run All Accounts")
+st.caption(
+    "Research runs first; the other accounts then run concurrently, "
+    "one worker process each (up to 8)."
+)
+
+
+def _run_all(dry_run: bool) -> None:
+    """Run every account in parallel, updating a progress bar as each one finishes.
+
+    Holds the manual-cycle lock throughout, so it never overlaps a Run Now.
+    """
+    lock = _cycle_lock()
+    if not lock.acquire(blocking=False):
+        st.error(_BUSY_MSG)
+        return
+    label = "Dry run" if dry_run else "Run"
+    progress = st.progress(0.0, text=f"{label}: starting…")
+    failures: list[str] = []
+    outputs: list[str] = []
+    total = 0
+    done = 0
+
+    def _on_start(n: int) -> None:
+        nonlocal total
+        total = n
+
+    try:
+        for key, error, output in run_all_parallel(
+            dry_run=dry_run, config_path=_ORCH_CONFIG, on_start=_on_start,
+        ):
+            done += 1
+            progress.progress(done / total, text=f"{label}: {key} finished ({done}/{total})")
+            if error:
+                failures.append(f"{key}: {error}")
+            elif output:
+                outputs.append(output)
+    except Exception as e:
+        failures.append(f"{type(e).__name__}: {e}")
+    finally:
+        lock.release()
+    progress.empty()
+    if failures:
+        st.error("Failed: " + "\n".join(failures)[-500:])
+    else:
+        st.success("All dry runs completed" if dry_run else "All cycles completed")
+        if dry_run:
+            st.code("".join(outputs)[-3000:])
+
+
 col1, col2 = st.columns(2)
 with col1:
     if st.button("Run All Now"):
-        with st.spinner("Running all accounts..."):
-            result = subprocess.run(
-                [sys.executable, "-m", "src.main", "--all"],
-                capture_output=True,
-                text=True,
-                cwd=str(Path(__file__).resolve().parents[2]),
-                timeout=1800,
-            )
-            if result.returncode == 0:
-                st.success("All cycles completed")
-            else:
-                st.error(f"Failed: {result.stderr[-500:]}")
+        _run_all(dry_run=False)
 
 with col2:
     if st.button("Dry Run All"):
-        with st.spinner("Dry running all accounts..."):
-            result = subprocess.run(
-                [sys.executable, "-m", "src.main", "--all", "--dry-run"],
-                capture_output=True,
-                text=True,
-                cwd=str(Path(__file__).resolve().parents[2]),
-                timeout=1800,
-            )
-            if result.returncode == 0:
-                st.success("All dry runs completed")
-                st.code(result.stdout[-3000:])
-            else:
-                st.error(f"Failed: {result.stderr[-500:]}")
+        _run_all(dry_run=True)
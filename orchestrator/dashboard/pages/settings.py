@@ -2,17 +2,21 @@
 
 import streamlit as st
 import os
-import yaml
-from pathlib import Path
-import sys
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from dashboard.config_utils import config_to_yaml, load_config, raw_config_text, save_config
 
-from dashboard.config_utils import load_config, save_config
 
+_CURRENCY_OPTS = ("USD", "EUR", "GBP")
+_CURRENCY_IDX = {c: i for i, c in enumerate(_CURRENCY_OPTS)}
+_ENV_KEYS = ("GHOSTFOLIO_URL", "GHOSTFOLIO_ACCESS_TOKEN", "LLM_BASE_URL", "LOG_LEVEL")
 
 st.title("Settings")
 
+# Process environment doesn't change under a running session: read it once
+if "_env_snapshot" not in st.session_state:
+    st.session_state["_env_snapshot"] = {k: os.environ.get(k) for k in _ENV_KEYS}
+env = st.session_state["_env_snapshot"]
+
 config = load_config()
 defaults = config.get("defaults", {})
 
@@ -22,14 +26,14 @@ col1, col2 = st.columns(2)
 with col1:
     ghostfolio_url = st.text_input(
         "Ghostfolio URL",
-        value=os.environ.get("GHOSTFOLIO_URL", defaults.get("ghostfolio_url", "http://192.168.0.12:3333")),
+        value=env["GHOSTFOLIO_URL"] or defaults.get("ghostfolio_url", "http://192.168.0.12:3333"),
     )
     st.caption("External Ghostfolio instance")
 
 with col2:
     llm_url = st.text_input(
         "LLM Base URL (llama-swap)",
-        value=os.environ.get("LLM_BASE_URL", defaults.get("llm_base_url", "http://192.168.0.169:8080/v1")),
+        value=env["LLM_BASE_URL"] or defaults.get("llm_base_url", "http://192.168.0.169:8080/v1"),
     )
     st.caption("llama-swap OpenAI-compatible endpoint")
 
@@ -48,8 +52,8 @@ with col1:
 with col2:
     currency = st.selectbox(
         "Currency",
-        options=["USD", "EUR", "GBP"],
-        index=["USD", "EUR", "GBP"].index(defaults.get("currency", "USD")),
+        options=_CURRENCY_OPTS,
+        index=_CURRENCY_IDX.get(defaults.get("currency", "USD"), 0),
     )
 with col3:
     data_source = st.selectbox(
@@ -87,23 +91,26 @@ if st.button("Save Settings"):
         "news_cache_ttl_minutes": news_ttl,
         "quote_cache_ttl_seconds": quote_ttl,
     }
-    save_config(config)
-    st.success("Settings saved!")
+    if save_config(config):
+        st.success("Settings saved!")
+    else:
+        st.info("No changes to save.")
 
 st.divider()
 
 # Raw config viewer
 st.subheader("Raw Configuration")
-with st.expander("View config.yaml"):
-    st.code(yaml.dump(config, default_flow_style=False, sort_keys=False), language="yaml")
+# Content is only produced once the user asks for it (expander bodies always run)
+if st.toggle("Show config.yaml", key="_show_raw_config"):
+    raw = raw_config_text()
+    st.code(raw if raw is not None else config_to_yaml(config), language="yaml")
 
 # Environment variables
 st.subheader("Environment Variables")
 env_vars = {
-    "GHOSTFOLIO_URL": os.environ.get("GHOSTFOLIO_URL", "Not set"),
-    "GHOSTFOLIO_ACCESS_TOKEN": "***" if os.environ.get("GHOSTFOLIO_ACCESS_TOKEN") else "Not set",
-    "LLM_BASE_URL": os.environ.get("LLM_BASE_URL", "Not set"),
-    "LOG_LEVEL": os.environ.get("LOG_LEVEL", "Not set"),
+    "GHOSTFOLIO_URL": env["GHOSTFOLIO_URL"] or "Not set",
+    "GHOSTFOLIO_ACCESS_TOKEN": "***" if env["GHOSTFOLIO_ACCESS_TOKEN"] else "Not set",
+    "LLM_BASE_URL": env["LLM_BASE_URL"] or "Not set",
+    "LOG_LEVEL": env["LOG_LEVEL"] or "Not set",
 }
-for k, v in env_vars.items():
-    st.write(f"`{k}` = {v}")
+st.markdown("\n".join(f"- `{k}` = {v}" for k, v in env_vars.items()))
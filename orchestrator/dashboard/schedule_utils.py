@@ -0,0 +1,99 @@
+"""Cron schedule helpers shared by the overview, run control and research pages."""
+
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import streamlit as st
+
+try:
+    from apscheduler.triggers.cron import CronTrigger
+except ImportError:  # next-run times are simply omitted without APScheduler
+    CronTrigger = None
+
+_DOW_ISO = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]  # 0=Mon … 6=Sun
+# Whole-field day_of_week values answered by a single lookup
+_DOW_TRANSFORMS = {"*": "daily", **{str(i): d for i, d in enumerate(_DOW_ISO)}}
+_MINUTE_PATTERNS = {"*/30": "every 30 min"}
+_CRON_RE = re.compile(r"^\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*$")
+
+
+def _dow_label(dow_str: str) -> str:
+    """Convert APScheduler day_of_week field to readable label."""
+    dow_str = dow_str.strip()
+    label = _DOW_TRANSFORMS.get(dow_str)
+    if label is not None:
+        return label
+    dash = dow_str.find("-")
+    if dash >= 0:
+        return f"{_DOW_ISO[int(dow_str[:dash])]}–{_DOW_ISO[int(dow_str[dash + 1:])]}"
+    if "," in dow_str:
+        return "/".join(_DOW_ISO[int(d)] for d in dow_str.split(","))
+    return _DOW_ISO[int(dow_str)]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cron_to_human(cron: str) -> str:
+    """Convert a crontab string to a short human-readable description."""
+    if not cron:
+        return "no schedule"
+    m = _CRON_RE.match(cron)
+    if m is None:
+        return cron
+
+    minute, hour, dom, month, dow = m.groups()
+
+    # Hour range: intraday schedule
+    dash = hour.find("-")
+    if dash >= 0:
+        time_str = f"{hour[:dash]}:00–{hour[dash + 1:]}:59 every 30 min"
+        return f"{_dow_label(dow)} · {time_str} CET"
+
+    # Build time string
+    time_str = _MINUTE_PATTERNS.get(minute)
+    if time_str is None:
+        if "," in minute:
+            mins = ", ".join(f":{m.zfill(2)}" for m in minute.split(","))
+            time_str = f"{hour}:xx at {mins}"
+        else:
+            time_str = f"{hour}:{minute.zfill(2)}"
+
+    # Build frequency string
+    if dom != "*" and dom.isdigit():
+        freq = f"Monthly (day {dom})"
+    elif dow == "*":
+        freq = "Daily"
+    else:
+        freq = _dow_label(dow)
+
+    return f"{freq} · {time_str} CET"
+
+
+@lru_cache(maxsize=128)
+def _cron_trigger(minute: str, hour: str, dom: str, month: str, dow: str):
+    """Build (once per field tuple) the APScheduler trigger for a cron expression."""
+    return CronTrigger(
+        minute=minute, hour=hour,
+        day=dom, month=month, day_of_week=dow,
+        timezone="Europe/Warsaw",
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def next_run_time(cron: str) -> str:
+    """Return 'Next: Weekday Mon DD at HH:MM' using APScheduler."""
+    if not cron or CronTrigger is None:
+        return ""
+    try:
+        parts = cron.split()
+        if len(parts) != 5:
+            return ""
+        trigger = _cron_trigger(*parts)
+        now = datetime.now(timezone.utc)
+        nxt = trigger.get_next_fire_time(None, now)
+        if nxt is None:
+            return ""
+        # Format as "Mon 25 Feb · 18:00"
+        return "Next: " + nxt.strftime("%a %d %b · %H:%M")
+    except Exception:
+        return ""
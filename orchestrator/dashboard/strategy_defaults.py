@@ -0,0 +1,34 @@
+"""Strategy templates, schedule presets and default watchlists for new accounts."""
+
+STRATEGY_TEMPLATES = {
+    "core_satellite": {
+        "description": "Core-Satellite: 60% ETF core + 30% stock satellites + 10% cash reserve",
+        "prompt_style": "Balance risk and return. Prefer broad ETF exposure as core, select individual stocks as satellites for alpha.",
+        "preferred_metrics": ["SMA", "RSI", "PE"],
+        "horizon": "weeks to months",
+    },
+    "value_investing": {
+        "description": "Value Investing: 40% ETF + 50% undervalued stocks + 10% cash reserve",
+        "prompt_style": "Seek undervalued assets with margin of safety. Focus on fundamentals, dividends, and long-term compounding.",
+        "preferred_metrics": ["PE", "PB", "DividendYield", "FCF"],
+        "horizon": "months to years",
+    },
+    "momentum": {
+        "description": "Momentum/Swing: 20% ETF + 70% high-momentum stocks + 10% cash reserve",
+        "prompt_style": "Ride momentum, cut losers fast. Focus on technical breakouts, volume surges, and trend strength.",
+        "preferred_metrics": ["RSI", "MACD", "Volume", "BollingerBands"],
+        "horizon": "days to weeks",
+    },
+}
+
+SCHEDULE_PRESETS = {
+    "Daily (Mon-Fri 18:00)": "0 18 * * 1-5",
+    "Weekly (Sunday 20:00)": "0 20 * * 0",
+    "Monthly (1st, 20:00)": "0 20 1 * *",
+}
+
+DEFAULT_WATCHLISTS = {
+    "core_satellite": "SPY, QQQ, VTI, AAPL, MSFT, GOOGL, AMZN, NVDA, BRK-B, JPM",
+    "value_investing": "BRK-B, JPM, JNJ, PG, KO, VZ, XOM, CVX, WMT, BAC",
+    "momentum": "NVDA, AMD, TSLA, SMCI, META, PLTR, ARM, CRWD, PANW, SQ",
+}
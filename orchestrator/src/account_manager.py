@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
 import yaml
 import structlog
 
+from .config_io import write_config
 from .ghostfolio_client import GhostfolioClient
 
 logger = structlog.get_logger()
 
+# libyaml-backed loader when available, pure-Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by path, valid while (st_mtime_ns, st_size) is unchanged
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
 
 class AccountManager:
     """Manages account lifecycle between config.yaml and Ghostfolio."""
@@ -20,21 +31,59 @@ class AccountManager:
         self.config_path = Path(config_path)
         self.client = client or GhostfolioClient()
         self._config: dict | None = None
+        self._batch_depth = 0
+        self._dirty = False
 
     def load_config(self) -> dict:
-        """Load config.yaml."""
-        with open(self.config_path) as f:
-            self._config = yaml.safe_load(f)
+        """Load config.yaml, reusing the last parse while the file is unchanged."""
+        st = os.stat(self.config_path)
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            # Hand out a copy so in-place edits don't leak into the cache
+            self._config = copy.deepcopy(cached[2])
+            return self._config
+        with open(self.config_path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        _CONFIG_CACHE[self.config_path] = (st.st_mtime_ns, st.st_size, data)
+        self._config = copy.deepcopy(data)
         return self._config
 
-    def save_config(self, config: dict | None = None) -> None:
-        """Save config.yaml."""
+    def save_config(self, config: dict | None = None) -> bool:
+        """Save config.yaml atomically; skip the write if nothing changed.
+
+        Returns True if the file was written.
+        """
         cfg = config or self._config
         if cfg is None:
             raise ValueError("No config to save")
-        with open(self.config_path, "w") as f:
-            yaml.dump(cfg, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        if not write_config(self.config_path, cfg):
+            logger.debug("config_unchanged", path=str(self.config_path))
+            return False
+        _CONFIG_CACHE.pop(self.config_path, None)
         logger.info("config_saved", path=str(self.config_path))
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator[AccountManager]:
+        """Coalesce config writes from several mutations into one save on exit.
+
+        Nested batches save once, when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.save_config()
+
+    def _config_changed(self) -> None:
+        """Persist a mutation now, or defer it to the enclosing batch()."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save_config()
 
     @property
     def config(self) -> dict:
@@ -56,9 +105,11 @@ class AccountManager:
         Returns mapping of account_key -> ghostfolio_account_id.
         """
         accounts = self.get_accounts()
-        initial_budget = self.config.get("defaults", {}).get("initial_budget", 10000)
+        defaults = self.config.get("defaults", {})
+        initial_budget = defaults.get("initial_budget", 10000)
+        currency = defaults.get("currency", "USD")
         result: dict[str, str] = {}
-        config_changed = False
+        to_create: list[tuple[str, str]] = []
 
         # Cycle types that don't trade and need no Ghostfolio account
         _NON_TRADING = {"research"}
@@ -71,9 +122,9 @@ class AccountManager:
                 raw_list = all_accts.get("accounts", []) or []
             else:
                 raw_list = all_accts if isinstance(all_accts, list) else []
-            for a in raw_list:
-                if isinstance(a, dict) and a.get("id"):
-                    gf_accounts_by_id[a["id"]] = a
+            gf_accounts_by_id = {
+                a["id"]: a for a in raw_list if isinstance(a, dict) and a.get("id")
+            }
         except Exception as e:
             logger.warning("ensure_accounts_list_failed", error=str(e))
 
@@ -83,7 +134,6 @@ class AccountManager:
 
             gf_id = acct.get("ghostfolio_account_id", "TBD")
             name = acct.get("name", key)
-            currency = self.config.get("defaults", {}).get("currency", "USD")
 
             if gf_id and gf_id != "TBD":
                 existing = gf_accounts_by_id.get(gf_id)
@@ -103,23 +153,29 @@ class AccountManager:
                 else:
                     logger.warning("account_not_found_in_ghostfolio", key=key, id=gf_id)
 
-            # Create new account
-            try:
-                new_account = self.client.create_account(
-                    name=name,
-                    balance=initial_budget,
-                    currency=currency,
-                )
-                new_id = new_account["id"]
-                accounts[key]["ghostfolio_account_id"] = new_id
-                result[key] = new_id
-                config_changed = True
-                logger.info("account_created", key=key, ghostfolio_id=new_id, balance=initial_budget)
-            except Exception as e:
-                logger.error("account_creation_failed", key=key, error=str(e))
-
-        if config_changed:
-            self.save_config()
+            to_create.append((key, name))
+
+        # Create missing accounts — independent round trips, issued concurrently;
+        # the ID write-backs are saved once when the batch exits
+        if to_create:
+            with self.batch(), ThreadPoolExecutor(max_workers=min(8, len(to_create))) as pool:
+                futures = {
+                    pool.submit(
+                        self.client.create_account,
+                        name=name, balance=initial_budget, currency=currency,
+                    ): key
+                    for key, name in to_create
+                }
+                for fut in as_completed(futures):
+                    key = futures[fut]
+                    try:
+                        new_id = fut.result()["id"]
+                    except Exception as e:
+                        logger.error("account_creation_failed", key=key, error=str(e))
+                        continue
+                    self.update_account(key, {"ghostfolio_account_id": new_id})
+                    result[key] = new_id
+                    logger.info("account_created", key=key, ghostfolio_id=new_id, balance=initial_budget)
 
         return result
 
@@ -167,7 +223,7 @@ class AccountManager:
             "risk_profile": risk_profile,
             "watchlist": watchlist,
         }
-        self.save_config()
+        self._config_changed()
         logger.info("account_added", key=key, ghostfolio_id=gf_id)
         return gf_id
 
@@ -176,7 +232,7 @@ class AccountManager:
         accounts = self.config.get("accounts", {})
         if key in accounts:
             del accounts[key]
-            self.save_config()
+            self._config_changed()
             logger.info("account_removed", key=key)
             return True
         return False
@@ -187,7 +243,7 @@ class AccountManager:
         if acct is None:
             raise ValueError(f"Account '{key}' not found")
         acct.update(updates)
-        self.save_config()
+        self._config_changed()
         logger.info("account_updated", key=key, fields=list(updates.keys()))
 
     def list_account_summaries(self) -> list[dict]:
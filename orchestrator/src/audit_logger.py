@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 import structlog
 
 logger = structlog.get_logger()
@@ -14,6 +19,80 @@ logger = structlog.get_logger()
 LOGS_DIR = Path("logs")
 DB_PATH = Path("data/audit.db")
 
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Indented like the old json.dump(indent=2, default=str) output, but orjson
+# writes datetimes as ISO 8601 with a "T" separator and NaN/Infinity as null;
+# _read_log still accepts the NaN literals found in older files
+_LOG_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _read_log(log_file: str) -> dict:
+    """Parse a cycle log file.
+
+    Logs written by the old json.dump writer may contain NaN/Infinity
+    literals, which orjson rejects; those fall back to the stdlib parser.
+    """
+    raw = Path(log_file).read_bytes()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def _decision_summary(decision: dict, trades: list) -> dict:
+    """Project a pass-2 decision and its executed trades onto a history entry."""
+    actions_raw = decision.get("actions", [])
+    if not isinstance(actions_raw, list):
+        actions_raw = []
+
+    # Match results to actions
+    actions = []
+    for a in actions_raw:
+        if not isinstance(a, dict):
+            continue
+        action_data = {
+            "type": a.get("type"),
+            "symbol": a.get("symbol"),
+            "amount_usd": a.get("amount_usd", 0),
+            "thesis": a.get("thesis", ""),
+        }
+        # Find matching trade result
+        for t in trades:
+            if (t.get("symbol") == a.get("symbol") and
+                    t.get("type") == a.get("type")):
+                action_data["result_pct"] = t.get("result_pct")
+                break
+        actions.append(action_data)
+
+    return {
+        "outlook": decision.get("portfolio_outlook", "Unknown"),
+        "confidence": decision.get("confidence", "N/A"),
+        "actions": actions,
+        "hold_reason": decision.get("reasoning", "")[:100] if not actions else "",
+    }
+
+
+@lru_cache(maxsize=1024)
+def _load_log_summary(log_file: str, mtime_ns: int) -> dict:
+    """Decision summary of one cycle log, parsed once per (file, mtime).
+
+    Only needed for rows written before decision_log.summary_json existed.
+    Log files are write-once, so the mtime key only guards against a file
+    being replaced in place.
+    """
+    entry = _read_log(log_file)
+    decision = entry.get("pass2", {}).get("response", {})
+    if not isinstance(decision, dict):
+        decision = {}
+    return _decision_summary(decision, entry.get("executed_trades", []))
+
 
 class AuditLogger:
     """Logs every decision cycle with full context for auditability."""
@@ -23,11 +102,24 @@ class AuditLogger:
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One autocommit connection for the logger's lifetime, shared across
+        # threads (dashboard pages reuse a single instance) behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
         self._init_db()
 
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
     def _init_db(self) -> None:
         """Initialize SQLite summary table and options positions table."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS decision_log (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,6 +175,37 @@ class AuditLogger:
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # Decision summary for prompt history, added after the first release
+            columns = {r["name"] for r in conn.execute("PRAGMA table_info(decision_log)")}
+            if "summary_json" not in columns:
+                conn.execute("ALTER TABLE decision_log ADD COLUMN summary_json TEXT")
+            # Model comparison GROUP BYs and options page filters
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_decision_model ON decision_log(model)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_decision_acct_model ON decision_log(account_name, model)"
+            )
+            # Latest-row-per-account lookups (dashboard overview cards) and
+            # per-account history / recent-log queries
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_decision_acct_ts
+                ON decision_log(account_key, timestamp DESC)"""
+            )
+            # Chart queries (successful rows only, per account, by time); the
+            # latest-per-account P/L lookup is served by idx_decision_acct_ts
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_decision_log_acct_ts
+                ON decision_log(account_key, timestamp) WHERE success = 1"""
+            )
+            # Unfiltered recent-log feed (audit page "all accounts")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_decision_ts ON decision_log(timestamp DESC)")
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_opt_acct_status_exp
+                ON options_positions(account_key, status, expiration_date)"""
+            )
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_opt_acct_status_close
+                ON options_positions(account_key, status, close_date DESC)"""
+            )
 
     def log_cycle(
         self,
@@ -139,8 +262,7 @@ class AuditLogger:
 
         # Write JSON log file
         log_file = self.logs_dir / f"{date_str}_{account_key}_{time_str}.json"
-        with open(log_file, "w") as f:
-            json.dump(log_entry, f, indent=2, default=str)
+        log_file.write_bytes(orjson.dumps(log_entry, option=_LOG_JSON_OPTS, default=str))
 
         # Write summary to SQLite
         analysis = pass1_response if isinstance(pass1_response, dict) else {}
@@ -151,14 +273,22 @@ class AuditLogger:
         p_after = portfolio_after if isinstance(portfolio_after, dict) else p_before
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            summary_json = orjson.dumps(
+                _decision_summary(decision, executed_trades or []), default=str
+            ).decode()
+        except (AttributeError, TypeError, orjson.JSONEncodeError) as e:
+            logger.warning("audit_summary_failed", error=str(e))
+            summary_json = None
+
+        try:
+            with self._lock:
+                self._conn.execute(
                     """INSERT INTO decision_log
                     (timestamp, account_key, account_name, model, market_regime,
                      portfolio_outlook, confidence, actions_count, forced_actions_count,
                      rejected_count, portfolio_value, portfolio_pl_pct, cash,
-                     log_file, success, error)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                     log_file, success, error, summary_json)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                     (
                         now.isoformat(),
                         account_key,
@@ -176,6 +306,7 @@ class AuditLogger:
                         str(log_file),
                         0 if error else 1,
                         error,
+                        summary_json,
                     ),
                 )
         except Exception as e:
@@ -191,10 +322,9 @@ class AuditLogger:
     ) -> list[dict]:
         """Get recent decision history for prompt injection."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                rows = conn.execute(
-                    """SELECT timestamp, log_file FROM decision_log
+            with self._lock:
+                rows = self._conn.execute(
+                    """SELECT timestamp, log_file, summary_json FROM decision_log
                     WHERE account_key = ? AND success = 1
                     ORDER BY timestamp DESC LIMIT ?""",
                     (account_key, limit),
@@ -202,46 +332,15 @@ class AuditLogger:
 
             history = []
             for row in reversed(rows):
-                log_file = row["log_file"]
                 try:
-                    with open(log_file) as f:
-                        entry = json.load(f)
-                    decision = entry.get("pass2", {}).get("response", {})
-                    if not isinstance(decision, dict):
-                        decision = {}
-                    actions_raw = decision.get("actions", [])
-                    if not isinstance(actions_raw, list):
-                        actions_raw = []
-                    trades = entry.get("executed_trades", [])
-
-                    # Match results to actions
-                    actions = []
-                    for a in actions_raw:
-                        if not isinstance(a, dict):
-                            continue
-                        action_data = {
-                            "type": a.get("type"),
-                            "symbol": a.get("symbol"),
-                            "amount_usd": a.get("amount_usd", 0),
-                            "thesis": a.get("thesis", ""),
-                        }
-                        # Find matching trade result
-                        for t in trades:
-                            if (t.get("symbol") == a.get("symbol") and
-                                    t.get("type") == a.get("type")):
-                                action_data["result_pct"] = t.get("result_pct")
-                                break
-                        actions.append(action_data)
-
-                    history.append({
-                        "date": row["timestamp"][:10],
-                        "outlook": decision.get("portfolio_outlook", "Unknown"),
-                        "confidence": decision.get("confidence", "N/A"),
-                        "actions": actions,
-                        "hold_reason": decision.get("reasoning", "")[:100] if not actions else "",
-                    })
+                    if row["summary_json"]:
+                        summary = orjson.loads(row["summary_json"])
+                    else:
+                        log_file = row["log_file"]
+                        summary = _load_log_summary(log_file, os.stat(log_file).st_mtime_ns)
                 except (FileNotFoundError, json.JSONDecodeError, AttributeError, TypeError, KeyError):
                     continue
+                history.append({"date": row["timestamp"][:10], **summary})
 
             return history
         except Exception as e:
@@ -255,17 +354,16 @@ class AuditLogger:
     ) -> list[dict]:
         """Get recent log summaries for dashboard display."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._lock:
                 if account_key:
-                    rows = conn.execute(
+                    rows = self._conn.execute(
                         """SELECT * FROM decision_log
                         WHERE account_key = ?
                         ORDER BY timestamp DESC LIMIT ?""",
                         (account_key, limit),
                     ).fetchall()
                 else:
-                    rows = conn.execute(
+                    rows = self._conn.execute(
                         """SELECT * FROM decision_log
                         ORDER BY timestamp DESC LIMIT ?""",
                         (limit,),
@@ -275,11 +373,48 @@ class AuditLogger:
             logger.error("recent_logs_fetch_failed", error=str(e))
             return []
 
+    def latest_per_account(self, account_keys: list[str] | tuple[str, ...]) -> dict[str, dict]:
+        """Most recent log summary for each account key, fetched in one query.
+
+        Accounts without any logged cycle are omitted from the result.
+        """
+        if not account_keys:
+            return {}
+        placeholders = ",".join("?" * len(account_keys))
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"""SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY account_key ORDER BY timestamp DESC
+                        ) AS rn
+                        FROM decision_log
+                        WHERE account_key IN ({placeholders})
+                    ) WHERE rn = 1""",
+                    tuple(account_keys),
+                ).fetchall()
+        except Exception as e:
+            logger.error("latest_per_account_fetch_failed", error=str(e))
+            return {}
+        latest = {}
+        for row in rows:
+            entry = dict(row)
+            entry.pop("rn", None)
+            latest[entry["account_key"]] = entry
+        return latest
+
     def get_log_detail(self, log_file: str) -> dict | None:
         """Read full log file for detailed view."""
         try:
-            with open(log_file) as f:
-                return json.load(f)
+            return _read_log(log_file)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.error("log_detail_read_failed", file=log_file, error=str(e))
             return None
+
+    def get_log_details_bulk(self, log_files: list[str]) -> dict[str, dict]:
+        """Read several full log files concurrently. Unreadable files are omitted."""
+        if not log_files:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(log_files))) as pool:
+            details = list(pool.map(self.get_log_detail, log_files))
+        return {f: d for f, d in zip(log_files, details) if d is not None}
@@ -6,45 +6,140 @@ repeated API calls and ensure consistent data throughout the run.
 
 from __future__ import annotations
 
+import hashlib
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import yfinance as yf
 import structlog
+from curl_cffi import requests as curl_requests
 
 logger = structlog.get_logger()
 
+CACHE_DIR = Path("data/cache/backtest")
+
+# id(df) -> (weakref to df, normalized tz-naive index as int64 ns, Close, Volume).
+# Kept out of df.attrs because pandas deep-copies attrs into every derived frame.
+_ARRAYS: dict[int, tuple[weakref.ref, np.ndarray, np.ndarray, np.ndarray]] = {}
+
 
 def prefetch_history(
     symbols: list[str],
     start_date: str,
     end_date: str,
+    use_cache: bool = True,
 ) -> dict[str, pd.DataFrame]:
     """Fetch full OHLCV history for all symbols in one batch.
 
+    Uses a single ``yf.download`` call for the whole list and only falls
+    back to per-symbol ``Ticker.history`` for symbols missing from it.
+    Ranges that ended before today are cached as Parquet under CACHE_DIR
+    and served from disk on later runs.
+
     Args:
         symbols: List of ticker symbols to fetch.
         start_date: Start date string (YYYY-MM-DD). Should include extra
             lookback (e.g. 6 months before sim start) for indicator warmup.
         end_date: End date string (YYYY-MM-DD).
+        use_cache: Read/write the on-disk Parquet cache.
 
     Returns:
         Dict mapping symbol -> full OHLCV DataFrame for the period.
     """
     result: dict[str, pd.DataFrame] = {}
-    for symbol in symbols:
+    # A range reaching today can still gain bars, so only closed ranges are cached
+    use_cache = use_cache and end_date < date.today().isoformat()
+    if use_cache:
+        for symbol in symbols:
+            cache_file = _cache_file(symbol, start_date, end_date)
+            if cache_file.exists():
+                try:
+                    result[symbol] = pd.read_parquet(cache_file)
+                except Exception as e:
+                    logger.warning("backtest_cache_read_failed", symbol=symbol, error=str(e))
+        if result:
+            logger.debug("backtest_history_cache_hits", symbols=len(result))
+        symbols = [s for s in symbols if s not in result]
+    if not symbols:
+        return result
+
+    # One batched download; symbols it misses fall back to a per-ticker fetch.
+    # yfinance only accepts curl_cffi sessions, and its YfData singleton holds
+    # one session process-wide, so every request here shares the same one.
+    with curl_requests.Session(impersonate="chrome") as session:
         try:
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(start=start_date, end=end_date, interval="1d")
-            if df.empty:
-                logger.warning("backtest_empty_history", symbol=symbol,
-                               start=start_date, end=end_date)
-            else:
-                result[symbol] = df
-                logger.debug("backtest_history_fetched", symbol=symbol, rows=len(df))
+            raw = yf.download(
+                symbols, start=start_date, end=end_date, interval="1d",
+                group_by="ticker", auto_adjust=True, threads=True, progress=False,
+                session=session,
+            )
         except Exception as e:
-            logger.warning("backtest_history_failed", symbol=symbol, error=str(e))
+            logger.warning("backtest_batch_download_failed", symbols=len(symbols), error=str(e))
+            raw = pd.DataFrame()
+        batched = (
+            set(raw.columns.get_level_values(0))
+            if isinstance(raw.columns, pd.MultiIndex) else set()
+        )
+
+        frames: dict[str, pd.DataFrame | None] = {
+            s: raw[s].dropna(how="all") for s in symbols if s in batched
+        }
+        missing = [s for s in symbols if frames.get(s) is None or frames[s].empty]
+        if missing:
+            # Fallback fetches are independent round trips — overlap them
+            with ThreadPoolExecutor(max_workers=min(16, len(missing))) as ex:
+                futures = {
+                    ex.submit(_fetch_one, s, start_date, end_date, session): s
+                    for s in missing
+                }
+                for fut in as_completed(futures):
+                    frames[futures[fut]] = fut.result()
+
+    for symbol in symbols:
+        df = frames.get(symbol)
+        if df is None:
+            continue
+        if df.empty:
+            logger.warning("backtest_empty_history", symbol=symbol,
+                           start=start_date, end=end_date)
+        else:
+            result[symbol] = df
+            logger.debug("backtest_history_fetched", symbol=symbol, rows=len(df))
+            if use_cache:
+                _write_cache(symbol, start_date, end_date, df)
     return result
 
 
+def _cache_file(symbol: str, start_date: str, end_date: str) -> Path:
+    key = hashlib.sha1(f"{symbol}|{start_date}|{end_date}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def _write_cache(symbol: str, start_date: str, end_date: str, df: pd.DataFrame) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_cache_file(symbol, start_date, end_date), compression="zstd")
+    except Exception as e:
+        logger.warning("backtest_cache_write_failed", symbol=symbol, error=str(e))
+
+
+def _fetch_one(
+    symbol: str, start_date: str, end_date: str, session: curl_requests.Session,
+) -> pd.DataFrame | None:
+    """Fetch one symbol's daily history on the shared session; None if the request fails."""
+    try:
+        ticker = yf.Ticker(symbol, session=session)
+        return ticker.history(start=start_date, end=end_date, interval="1d")
+    except Exception as e:
+        logger.warning("backtest_history_failed", symbol=symbol, error=str(e))
+        return None
+
+
 def get_quotes_at_date(
     symbol: str,
     date: str,
@@ -72,37 +167,34 @@ def get_quotes_at_date(
                 "week52_high": 0, "week52_low": 0, "sector": "Unknown",
                 "industry": "Unknown", "name": symbol}
 
-    target = pd.Timestamp(date)
-    idx_naive = full_history_df.index.normalize()
-    if idx_naive.tz is not None:
-        idx_naive = idx_naive.tz_localize(None)
-    df = full_history_df[idx_naive <= target]
-    if df.empty:
+    pos = _rows_through(full_history_df, date)
+    if pos == 0:
         return {"symbol": symbol, "price": 0, "change_pct": 0, "volume": 0,
                 "avg_volume_10d": 0, "market_cap": 0, "pe_ratio": None,
                 "forward_pe": None, "pb_ratio": None, "dividend_yield": None,
                 "week52_high": 0, "week52_low": 0, "sector": "Unknown",
                 "industry": "Unknown", "name": symbol}
 
-    row = df.iloc[-1]
-    price = float(row["Close"])
+    _, close, volume = _arrays(full_history_df)
+    price = float(close[pos - 1])
 
     # Day-over-day change
-    if len(df) >= 2:
-        prev_close = float(df.iloc[-2]["Close"])
+    if pos >= 2:
+        prev_close = float(close[pos - 2])
         change_pct = ((price - prev_close) / prev_close * 100) if prev_close > 0 else 0.0
     else:
         change_pct = 0.0
 
     # 10-day average volume (for liquidity check in risk manager)
-    vol_series = df["Volume"].tail(10)
-    avg_volume_10d = int(vol_series.mean()) if len(vol_series) > 0 else 0
+    window = volume[max(0, pos - 10):pos]
+    avg_volume_10d = 0 if np.isnan(window).all() else int(np.nanmean(window))
+    last_volume = volume[pos - 1]
 
     return {
         "symbol": symbol,
         "price": price,
         "change_pct": change_pct,
-        "volume": int(row.get("Volume", 0)),
+        "volume": 0 if np.isnan(last_volume) else int(last_volume),
         "avg_volume_10d": avg_volume_10d,
         "market_cap": 0,
         "pe_ratio": None,
@@ -140,13 +232,44 @@ def get_history_up_to(
     if full_history_df is None or full_history_df.empty:
         return pd.DataFrame()
 
-    target = pd.Timestamp(as_of_date)
-    idx_naive = full_history_df.index.normalize()
-    if idx_naive.tz is not None:
-        idx_naive = idx_naive.tz_localize(None)
-    df = full_history_df[idx_naive <= target]
-    if df.empty:
+    pos = _rows_through(full_history_df, as_of_date)
+    if pos == 0:
         logger.debug("backtest_no_history_before_date", symbol=symbol, date=as_of_date)
         return pd.DataFrame()
 
-    return df.tail(lookback_days).copy()
+    return full_history_df.iloc[max(0, pos - lookback_days):pos].copy()
+
+
+def _arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (date index as int64 ns, Close, Volume) arrays for df, built once per frame.
+
+    The index is normalized to tz-naive dates so it compares directly
+    against simulation dates.
+    """
+    entry = _ARRAYS.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1:]
+    idx = df.index.normalize()
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    index_ns = idx.as_unit("ns").asi8  # same unit as Timestamp.value
+    close = df["Close"].to_numpy(dtype=np.float64)
+    if "Volume" in df.columns:
+        volume = df["Volume"].to_numpy(dtype=np.float64)
+    else:
+        volume = np.zeros(len(df))
+    key = id(df)
+    _ARRAYS[key] = (weakref.ref(df), index_ns, close, volume)
+    weakref.finalize(df, _ARRAYS.pop, key, None)
+    return index_ns, close, volume
+
+
+@lru_cache(maxsize=1024)
+def _date_ns(as_of: str) -> int:
+    """Parse a simulation date once; every symbol is sliced at the same dates."""
+    return pd.Timestamp(as_of).value
+
+
+def _rows_through(df: pd.DataFrame, as_of: str) -> int:
+    """Number of leading rows of the (date-sorted) df dated on or before as_of."""
+    return int(np.searchsorted(_arrays(df)[0], _date_ns(as_of), side="right"))
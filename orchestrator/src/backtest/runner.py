@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Callable
 
+import numpy as np
+import pandas as pd
 import structlog
 
 from ..decision_parser import parse_analysis, parse_decision
@@ -32,6 +34,8 @@ class BacktestResult:
     win_rate_pct: float            # % of SELL trades executed above avg_cost
     benchmark_return_pct: float    # SPY buy-and-hold return over same period
     error: str = ""
+    # Same trades as `trades`, one typed column per field (for tables/vectorised stats)
+    trades_df: pd.DataFrame = field(default_factory=lambda: _trades_to_frame([]))
 
 
 def run_backtest(
@@ -247,6 +251,7 @@ def run_backtest(
     return BacktestResult(
         snapshots=snapshots,
         trades=trades,
+        trades_df=_trades_to_frame(trades),
         decisions=decisions,
         final_value=round(final_value, 2),
         total_return_pct=round(total_return, 2),
@@ -348,6 +353,19 @@ def _empty_decision_entry(week_num: int, sim_date: str, error: str) -> dict:
     }
 
 
+def _trades_to_frame(trades: list[SimTrade]) -> pd.DataFrame:
+    """Convert trade records to a DataFrame with typed columns."""
+    return pd.DataFrame({
+        "date": pd.to_datetime([t.date for t in trades], format="%Y-%m-%d"),
+        "type": pd.Categorical([t.type for t in trades], categories=["BUY", "SELL"]),
+        "symbol": pd.Categorical([t.symbol for t in trades]),
+        "quantity": np.array([t.quantity for t in trades], dtype=np.float64),
+        "price": np.array([t.price for t in trades], dtype=np.float64),
+        "total": np.array([t.total for t in trades], dtype=np.float64),
+        "avg_cost": np.array([t.avg_cost for t in trades], dtype=np.float64),
+    })
+
+
 def _calc_max_drawdown(snapshots: list[dict]) -> float:
     """Calculate maximum peak-to-trough drawdown percentage."""
     if not snapshots:
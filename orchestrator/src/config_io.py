@@ -0,0 +1,51 @@
+"""config.yaml serialization and atomic writes shared by the orchestrator and dashboard."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# libyaml-backed dumper when PyYAML was built with it; pure-Python otherwise
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def config_to_yaml(config: dict) -> str:
+    """Serialize config exactly as write_config writes it."""
+    return yaml.dump(config, Dumper=_DUMPER, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
+def write_config(path: Path | str, config: dict) -> bool:
+    """Write config to path atomically; skip the write if the bytes are unchanged.
+
+    The YAML goes to a uniquely named temp file in the same directory, is
+    fsynced, then renamed over path, so readers never see a partial file
+    and concurrent writers never share a temp file. Leaving an unchanged
+    file alone keeps its mtime (and every mtime-keyed cache) intact.
+    Returns True if the file was written.
+    """
+    path = Path(path)
+    new_bytes = config_to_yaml(config).encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == new_bytes:
+                return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False,
+    ) as f:
+        tmp_path = f.name
+        try:
+            f.write(new_bytes)
+            f.flush()
+            os.fsync(f.fileno())  # durable before the rename makes it visible
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+    return True
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
+import multiprocessing
 import os
 import signal
 import sys
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, time as dtime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -45,19 +50,30 @@ from .options.spreads_executor import SpreadsExecutor
 from .options.spreads_prompt_builder import build_spreads_pass1_messages, build_spreads_pass2_messages
 from .options.spreads_risk_manager import SpreadsRiskManager, SpreadsRiskResult
 
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso", utc=False),
-        structlog.processors.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-)
+
+def configure_logging() -> None:
+    """Console structlog setup for orchestrator processes.
+
+    Called from the entry points rather than at import, so importing this
+    module (e.g. from the dashboard) leaves the host's logging alone.
+    """
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso", utc=False),
+            structlog.processors.add_log_level,
+            structlog.dev.ConsoleRenderer(),
+        ],
+        wrapper_class=structlog.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.PrintLoggerFactory(),
+    )
+
 
 logger = structlog.get_logger()
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Orchestrator:
     """Main orchestrator that runs the full decision cycle for an account."""
@@ -78,8 +94,8 @@ class Orchestrator:
         self._last_cycle_prices: dict[str, dict[str, float]] = {}
 
     def _load_config(self) -> None:
-        with open(self.config_path) as f:
-            self.config = yaml.safe_load(f)
+        with open(self.config_path, "rb") as f:
+            self.config = yaml.load(f, Loader=_YamlLoader)
 
     @staticmethod
     def _is_wheel_account(acct: dict) -> bool:
@@ -107,6 +123,24 @@ class Orchestrator:
             return False
         return dtime(9, 30) <= now_et.time() < dtime(16, 0)
 
+    def run_account(self, account_key: str) -> None:
+        """Run one cycle for an account, dispatching on its cycle type / strategy."""
+        acct_cfg = self.config.get("accounts", {}).get(account_key, {})
+        if acct_cfg.get("enabled") is False:
+            logger.info("account_disabled", account=account_key)
+            return
+        cycle_type = acct_cfg.get("cycle_type", "standard")
+        if cycle_type == "research":
+            self.run_research_cycle()
+        elif cycle_type == "intraday":
+            self.run_intraday_cycle(account_key)
+        elif self._is_wheel_account(acct_cfg):
+            self.run_options_cycle(account_key)
+        elif self._is_spreads_account(acct_cfg):
+            self.run_spreads_cycle(account_key)
+        else:
+            self.run_cycle(account_key)
+
     def run_intraday_cycle(self, account_key: str) -> None:
         """Intraday decision cycle with Pass 0 anti-overtrade filter.
 
@@ -1397,6 +1431,79 @@ def parse_cron(cron_str: str) -> dict:
     }
 
 
+def run_once(
+    account_key: str,
+    dry_run: bool = False,
+    config_path: str = "../config.yaml",
+    ensure_accounts: bool = True,
+) -> None:
+    """In-process equivalent of ``python -m src.main --once <account_key>``."""
+    orch = Orchestrator(config_path=config_path, dry_run=dry_run)
+    if ensure_accounts:
+        orch.account_mgr.ensure_accounts_exist()
+    orch.run_account(account_key)
+
+
+def run_once_captured(
+    account_key: str,
+    dry_run: bool,
+    config_path: str,
+    ensure_accounts: bool = False,
+) -> str:
+    """Pool worker: run one account cycle and return everything it printed.
+
+    Meant to run in a child process — redirect_stdout swaps sys.stdout for
+    the whole process.
+    """
+    configure_logging()
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        run_once(account_key, dry_run=dry_run, config_path=config_path, ensure_accounts=ensure_accounts)
+    return buf.getvalue()
+
+
+def run_all_parallel(
+    keys: list[str] | None = None,
+    dry_run: bool = False,
+    config_path: str = "../config.yaml",
+    max_workers: int = 8,
+    on_start: Callable[[int], None] | None = None,
+) -> Iterator[tuple[str, str | None, str]]:
+    """Run independent account cycles in a process pool (``--all``, but concurrent).
+
+    Ghostfolio accounts are ensured once up front (it may rewrite the config),
+    then one cycle per key runs in its own worker. ``keys=None`` means every
+    account in the config. Research cycles run to completion first, since the
+    trading cycles read the brief they write. ``on_start`` receives the number
+    of cycles about to run. Yields ``(account_key, error_or_None, captured_stdout)``
+    as each cycle finishes.
+    """
+    account_mgr = AccountManager(config_path=config_path)
+    account_mgr.ensure_accounts_exist()
+    accounts = account_mgr.get_accounts()
+    if keys is None:
+        keys = list(accounts)
+    if on_start is not None:
+        on_start(len(keys))
+    if not keys:
+        return
+    research = [k for k in keys if accounts.get(k, {}).get("cycle_type") == "research"]
+    trading = [k for k in keys if k not in research]
+    # spawn, not fork: callers such as the dashboard are multi-threaded
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(len(keys), max_workers), mp_context=ctx) as pool:
+        for wave in (research, trading):
+            futures = {
+                pool.submit(run_once_captured, key, dry_run, config_path): key for key in wave
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    yield key, None, future.result()
+                except Exception as e:
+                    yield key, f"{type(e).__name__}: {e}", ""
+
+
 def main():
     parser = argparse.ArgumentParser(description="AI Investment Orchestrator")
     parser.add_argument("--once", type=str, help="Run single cycle for account key, then exit")
@@ -1404,6 +1511,7 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Don't execute real trades")
     parser.add_argument("--config", default="../config.yaml", help="Config file path")
     args = parser.parse_args()
+    configure_logging()
 
     orch = Orchestrator(config_path=args.config, dry_run=args.dry_run)
 
@@ -1413,40 +1521,13 @@ def main():
 
     if args.once:
         logger.info("running_single_cycle", account=args.once)
-        acct_cfg = orch.config.get("accounts", {}).get(args.once, {})
-        if acct_cfg.get("enabled") is False:
-            logger.info("account_disabled", account=args.once)
-            return
-        cycle_type = acct_cfg.get("cycle_type", "standard")
-        if cycle_type == "research":
-            orch.run_research_cycle()
-        elif cycle_type == "intraday":
-            orch.run_intraday_cycle(args.once)
-        elif orch._is_wheel_account(acct_cfg):
-            orch.run_options_cycle(args.once)
-        elif orch._is_spreads_account(acct_cfg):
-            orch.run_spreads_cycle(args.once)
-        else:
-            orch.run_cycle(args.once)
+        orch.run_account(args.once)
         return
 
     if args.all:
         logger.info("running_all_accounts")
-        for key, acct_cfg in orch.config.get("accounts", {}).items():
-            if acct_cfg.get("enabled") is False:
-                logger.info("account_disabled_skipped", account=key)
-                continue
-            cycle_type = acct_cfg.get("cycle_type", "standard")
-            if cycle_type == "research":
-                orch.run_research_cycle()
-            elif cycle_type == "intraday":
-                orch.run_intraday_cycle(key)
-            elif orch._is_wheel_account(acct_cfg):
-                orch.run_options_cycle(key)
-            elif orch._is_spreads_account(acct_cfg):
-                orch.run_spreads_cycle(key)
-            else:
-                orch.run_cycle(key)
+        for key in orch.config.get("accounts", {}):
+            orch.run_account(key)
         return
 
     # Scheduled mode: set up cron jobs for each account
@@ -0,0 +1,173 @@
+"""Tests for AccountManager config persistence."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+from src import account_manager
+from src.account_manager import AccountManager
+
+CONFIG = """\
+defaults:
+  initial_budget: 10000
+  currency: USD
+accounts:
+  alpha:
+    name: Alpha
+    ghostfolio_account_id: gf-alpha
+    model: m
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    account_manager._CONFIG_CACHE.clear()
+    yield
+    account_manager._CONFIG_CACHE.clear()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+@pytest.fixture
+def manager(config_file):
+    """Manager with a mocked Ghostfolio client."""
+    client = MagicMock()
+    client.create_account.side_effect = lambda name, **_: {"id": f"gf-{name.lower()}"}
+    return AccountManager(config_path=str(config_file), client=client)
+
+
+def _add(mgr: AccountManager, key: str) -> None:
+    mgr.add_account(
+        key=key, name=key.title(), model="m", cron="0 9 * * 1",
+        strategy="s", risk_profile={}, watchlist=["SPY"],
+    )
+
+
+class TestLoadConfigCache:
+    def test_unchanged_file_is_parsed_once(self, config_file, monkeypatch):
+        load = MagicMock(wraps=yaml.load)
+        monkeypatch.setattr(account_manager.yaml, "load", load)
+        AccountManager(config_path=str(config_file), client=MagicMock()).load_config()
+        AccountManager(config_path=str(config_file), client=MagicMock()).load_config()
+        assert load.call_count == 1
+
+    def test_returned_config_is_isolated_from_cache(self, config_file):
+        first = AccountManager(config_path=str(config_file), client=MagicMock()).load_config()
+        first["accounts"]["alpha"]["model"] = "mutated"
+        first["accounts"]["beta"] = {}
+        second = AccountManager(config_path=str(config_file), client=MagicMock()).load_config()
+        assert second["accounts"]["alpha"]["model"] == "m"
+        assert "beta" not in second["accounts"]
+        assert second is not first
+
+    def test_mtime_change_invalidates(self, manager, config_file):
+        manager.load_config()
+        stat = config_file.stat()
+        config_file.write_text(CONFIG.replace("model: m", "model: n"))  # same size
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert manager.load_config()["accounts"]["alpha"]["model"] == "n"
+
+    def test_size_change_invalidates(self, manager, config_file):
+        manager.load_config()
+        stat = config_file.stat()
+        config_file.write_text(CONFIG.replace("model: m", "model: longer"))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # same mtime
+        assert manager.load_config()["accounts"]["alpha"]["model"] == "longer"
+
+    def test_save_config_drops_cache_entry(self, manager, config_file):
+        manager.load_config()
+        assert config_file in account_manager._CONFIG_CACHE
+        manager.update_account("alpha", {"model": "saved"})
+        assert config_file not in account_manager._CONFIG_CACHE
+        other = AccountManager(config_path=str(config_file), client=MagicMock())
+        assert other.load_config()["accounts"]["alpha"]["model"] == "saved"
+
+
+class TestSaveConfig:
+    def test_unchanged_config_is_not_rewritten(self, manager, config_file):
+        manager.load_config()
+        manager.save_config()  # normalise to the dumper's formatting
+        mtime = config_file.stat().st_mtime_ns
+        assert manager.save_config() is False
+        assert config_file.stat().st_mtime_ns == mtime
+
+    def test_write_is_atomic_replace(self, manager, config_file, monkeypatch):
+        replaced = []
+        real_replace = os.replace
+
+        def spy(src, dst):
+            replaced.append((str(src), str(dst)))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", spy)
+        manager.update_account("alpha", {"model": "new"})
+        assert len(replaced) == 1
+        tmp, dst = replaced[0]
+        assert dst == str(config_file)
+        assert os.path.dirname(tmp) == str(config_file.parent)
+        assert os.path.basename(tmp).startswith("config.yaml.") and tmp.endswith(".tmp")
+        assert list(config_file.parent.glob("*.tmp")) == []
+        assert "model: new" in config_file.read_text()
+
+    def test_each_write_uses_its_own_temp_file(self, manager, config_file, monkeypatch):
+        temps = []
+        real_replace = os.replace
+
+        def spy(src, dst):
+            temps.append(str(src))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", spy)
+        other = AccountManager(config_path=str(config_file), client=MagicMock())
+        manager.update_account("alpha", {"model": "one"})
+        other.update_account("alpha", {"model": "two"})
+        assert len(temps) == 2 and temps[0] != temps[1]
+
+
+class TestBatch:
+    def test_mutations_saved_once_on_exit(self, manager, config_file, monkeypatch):
+        save = MagicMock(wraps=manager.save_config)
+        monkeypatch.setattr(manager, "save_config", save)
+        with manager.batch():
+            _add(manager, "beta")
+            manager.update_account("alpha", {"model": "x"})
+            assert "beta" not in config_file.read_text()
+        assert save.call_count == 1
+        text = config_file.read_text()
+        assert "beta" in text and "model: x" in text
+
+    def test_nested_batches_save_at_outermost_exit(self, manager, config_file, monkeypatch):
+        save = MagicMock(wraps=manager.save_config)
+        monkeypatch.setattr(manager, "save_config", save)
+        with manager.batch():
+            with manager.batch():
+                _add(manager, "beta")
+            assert save.call_count == 0
+            manager.remove_account("alpha")
+        assert save.call_count == 1
+        assert "alpha" not in config_file.read_text()
+
+    def test_clean_batch_does_not_save(self, manager, monkeypatch):
+        save = MagicMock(wraps=manager.save_config)
+        monkeypatch.setattr(manager, "save_config", save)
+        with manager.batch():
+            manager.get_accounts()
+        save.assert_not_called()
+
+    def test_ensure_accounts_saves_created_ids_once(self, manager, config_file, monkeypatch):
+        manager.client.list_accounts.return_value = [{"id": "gf-alpha", "name": "Alpha"}]
+        manager.config["accounts"]["beta"] = {"name": "Beta", "ghostfolio_account_id": "TBD"}
+        manager.config["accounts"]["gamma"] = {"name": "Gamma"}
+        save = MagicMock(wraps=manager.save_config)
+        monkeypatch.setattr(manager, "save_config", save)
+        result = manager.ensure_accounts_exist()
+        assert result == {"alpha": "gf-alpha", "beta": "gf-beta", "gamma": "gf-gamma"}
+        assert save.call_count == 1
+        assert "gf-gamma" in config_file.read_text()
@@ -0,0 +1,111 @@
+"""Tests for AuditLogger log reads."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.audit_logger import AuditLogger
+
+
+@pytest.fixture
+def audit(tmp_path):
+    """Fresh logger writing into a temp directory."""
+    return AuditLogger(logs_dir=tmp_path / "logs", db_path=tmp_path / "audit.db")
+
+
+class TestGetLogDetailsBulk:
+    def test_reads_all_files(self, audit):
+        files = [
+            audit.log_cycle(account_key=f"acct_{i}", account_name=f"Acct {i}", model="m")
+            for i in range(3)
+        ]
+        details = audit.get_log_details_bulk(files)
+        assert set(details) == set(files)
+        assert details[files[1]]["account_key"] == "acct_1"
+
+    def test_skips_missing_files(self, audit, tmp_path):
+        good = audit.log_cycle(account_key="a", account_name="A", model="m")
+        details = audit.get_log_details_bulk([good, str(tmp_path / "missing.json")])
+        assert list(details) == [good]
+
+    def test_empty_input(self, audit):
+        assert audit.get_log_details_bulk([]) == {}
+
+    def test_reads_legacy_nan_literals(self, audit, tmp_path):
+        legacy = tmp_path / "legacy.json"
+        legacy.write_text('{"account_key": "a", "portfolio_after": {"total_pl_pct": NaN}}')
+        detail = audit.get_log_detail(str(legacy))
+        assert detail["account_key"] == "a"
+
+
+class TestLatestPerAccount:
+    def test_returns_newest_row_per_account(self, audit):
+        audit.log_cycle(account_key="a", account_name="A", model="old")
+        audit.log_cycle(account_key="b", account_name="B", model="m")
+        audit.log_cycle(account_key="a", account_name="A", model="new")
+        latest = audit.latest_per_account(["a", "b"])
+        assert set(latest) == {"a", "b"}
+        assert latest["a"]["model"] == "new"
+        assert "rn" not in latest["a"]
+
+    def test_omits_accounts_without_logs(self, audit):
+        audit.log_cycle(account_key="a", account_name="A", model="m")
+        assert list(audit.latest_per_account(["a", "never_ran"])) == ["a"]
+
+    def test_empty_input(self, audit):
+        assert audit.latest_per_account([]) == {}
+
+
+class TestGetDecisionHistory:
+    def test_summarises_logged_decision(self, audit):
+        audit.log_cycle(
+            account_key="a", account_name="A", model="m",
+            pass2_response={
+                "portfolio_outlook": "bullish",
+                "confidence": 0.8,
+                "actions": [{"type": "BUY", "symbol": "AAPL", "amount_usd": 500}],
+            },
+            executed_trades=[{"type": "BUY", "symbol": "AAPL", "result_pct": 1.5}],
+        )
+        [entry] = audit.get_decision_history("a")
+        assert entry["outlook"] == "bullish"
+        assert entry["actions"][0]["symbol"] == "AAPL"
+        assert entry["actions"][0]["result_pct"] == 1.5
+        assert entry["hold_reason"] == ""
+
+    def test_reads_summary_without_log_file(self, audit):
+        log_file = audit.log_cycle(
+            account_key="a", account_name="A", model="m",
+            pass2_response={"portfolio_outlook": "bullish", "reasoning": "wait"},
+        )
+        Path(log_file).unlink()
+        [entry] = audit.get_decision_history("a")
+        assert entry["outlook"] == "bullish"
+        assert entry["hold_reason"] == "wait"
+
+    def test_rereads_replaced_legacy_log_file(self, audit):
+        log_file = audit.log_cycle(
+            account_key="a", account_name="A", model="m",
+            pass2_response={"portfolio_outlook": "bullish", "reasoning": "wait"},
+        )
+        # Rows logged before summary_json existed fall back to the log file
+        audit._conn.execute("UPDATE decision_log SET summary_json = NULL")
+        assert audit.get_decision_history("a")[0]["outlook"] == "bullish"
+
+        path = Path(log_file)
+        path.write_text(path.read_text().replace("bullish", "bearish"))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert audit.get_decision_history("a")[0]["outlook"] == "bearish"
+
+    def test_legacy_log_with_nan_literals_kept(self, audit):
+        log_file = audit.log_cycle(
+            account_key="a", account_name="A", model="m",
+            pass2_response={"portfolio_outlook": "bullish"},
+        )
+        audit._conn.execute("UPDATE decision_log SET summary_json = NULL")
+        path = Path(log_file)
+        path.write_text(path.read_text().replace('"fees_paid": 0.0', '"fees_paid": NaN'))
+        assert "NaN" in path.read_text()
+        assert audit.get_decision_history("a")[0]["outlook"] == "bullish"
@@ -0,0 +1,83 @@
+"""Tests for backtest history slicing and quote extraction."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.historical_data import get_history_up_to, get_quotes_at_date
+
+
+def _history(n: int = 15, tz: str | None = None) -> pd.DataFrame:
+    """n business days of OHLCV starting 2024-01-01, Close = 100 + day index."""
+    idx = pd.date_range("2024-01-01", periods=n, freq="B", tz=tz)
+    close = 100.0 + np.arange(n)
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close,
+         "Volume": np.full(n, 1000.0)},
+        index=idx,
+    )
+
+
+class TestGetQuotesAtDate:
+    def test_price_on_trading_day(self):
+        quote = get_quotes_at_date("X", "2024-01-03", _history())
+        assert quote["price"] == pytest.approx(102.0)
+        assert quote["change_pct"] == pytest.approx(1 / 101 * 100)
+
+    def test_weekend_uses_previous_close(self):
+        assert get_quotes_at_date("X", "2024-01-06", _history())["price"] == pytest.approx(104.0)
+
+    def test_tz_aware_index_matches_naive(self):
+        naive = get_quotes_at_date("X", "2024-01-10", _history())
+        aware = get_quotes_at_date("X", "2024-01-10", _history(tz="America/New_York"))
+        assert aware == naive
+
+    def test_non_ns_index_unit(self):
+        df = _history()
+        df.index = df.index.as_unit("us")
+        assert get_quotes_at_date("X", "2024-01-03", df)["price"] == pytest.approx(102.0)
+
+    def test_date_before_first_row(self):
+        quote = get_quotes_at_date("X", "2023-12-29", _history())
+        assert quote["price"] == 0
+        assert quote["avg_volume_10d"] == 0
+
+    def test_nan_volume_is_skipped_in_average(self):
+        df = _history()
+        df.iloc[-3, df.columns.get_loc("Volume")] = np.nan
+        quote = get_quotes_at_date("X", "2024-01-19", df)
+        assert quote["avg_volume_10d"] == 1000
+
+    def test_all_nan_volume_window_is_zero(self):
+        df = _history()
+        df["Volume"] = np.nan
+        quote = get_quotes_at_date("X", "2024-01-19", df)
+        assert quote["avg_volume_10d"] == 0
+        assert quote["volume"] == 0
+        assert quote["price"] == pytest.approx(114.0)
+
+
+class TestGetHistoryUpTo:
+    def test_excludes_rows_after_date(self):
+        sliced = get_history_up_to("X", "2024-01-10", _history())
+        assert sliced.index[-1] == pd.Timestamp("2024-01-10")
+        assert len(sliced) == 8
+
+    def test_lookback_keeps_most_recent_rows(self):
+        sliced = get_history_up_to("X", "2024-01-10", _history(), lookback_days=3)
+        assert list(sliced["Close"]) == [105.0, 106.0, 107.0]
+
+    def test_tz_aware_intraday_stamps_use_local_date(self):
+        df = _history(tz="America/New_York")
+        df.index = df.index + pd.Timedelta(hours=20)  # 20:00 New York is the next day in UTC
+        sliced = get_history_up_to("X", "2024-01-10", df)
+        assert len(sliced) == 8
+
+    def test_date_before_first_row_is_empty(self):
+        assert get_history_up_to("X", "2023-12-29", _history()).empty
+
+    def test_returns_a_copy(self):
+        df = _history()
+        sliced = get_history_up_to("X", "2024-01-10", df)
+        sliced["Close"] = 0.0
+        assert df["Close"].iloc[0] == 100.0